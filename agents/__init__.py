@@ -10,24 +10,36 @@ Agent modules for Agentic Chaser.
 6. Workflow Orchestrator & Priority Agent (Core Brain)
 7. Provider Portal RPA Agent
 8. Predictive Intelligence Agent
+
+Agent entry points are imported lazily on first attribute access (PEP 562), so
+importing a single submodule (e.g. agents.fact_find_chasing) does not load every agent.
 """
 
-from agents.client_comms import client_communication_agent
-from agents.document_processing import document_processing_agent
-from agents.predictive_intelligence import predictive_intelligence_agent
-from agents.provider_comms import provider_communication_agent
-from agents.provider_rpa import provider_rpa_agent
-from agents.response_parser import response_parser_agent
-from agents.sentiment_analysis import sentiment_analysis_agent
-from agents.workflow_orchestrator import workflow_orchestrator_agent
-
-__all__ = [
-    "client_communication_agent",
-    "provider_communication_agent",
-    "document_processing_agent",
-    "sentiment_analysis_agent",
-    "response_parser_agent",
-    "workflow_orchestrator_agent",
-    "provider_rpa_agent",
-    "predictive_intelligence_agent",
-]
\ No newline at end of file
+from __future__ import annotations
+
+import importlib
+from typing import Any
+
+# Public name -> defining submodule
+_AGENT_MODULES: dict[str, str] = {
+    "client_communication_agent": "agents.client_comms",
+    "provider_communication_agent": "agents.provider_comms",
+    "document_processing_agent": "agents.document_processing",
+    "sentiment_analysis_agent": "agents.sentiment_analysis",
+    "response_parser_agent": "agents.response_parser",
+    "workflow_orchestrator_agent": "agents.workflow_orchestrator",
+    "provider_rpa_agent": "agents.provider_rpa",
+    "predictive_intelligence_agent": "agents.predictive_intelligence",
+}
+
+__all__ = list(_AGENT_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the agent on first access and cache it on the package."""
+    module_name = _AGENT_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
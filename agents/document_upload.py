@@ -7,8 +7,10 @@ Saves files to data/uploads and creates a DB row for validation and linking.
 from __future__ import annotations
 
 import re
+import shutil
 from datetime import datetime
 from pathlib import Path
+from typing import BinaryIO
 from uuid import uuid4
 
 from models.database import DocumentSubmission, session_scope
@@ -87,7 +89,7 @@ def copy_to_accepted_storage(
     name = f"{doc_type_safe}_{date_str}_{suffix}{ext}"
     dest = client_dir / name
     try:
-        dest.write_bytes(src.read_bytes())
+        shutil.copyfile(src, dest)
         return str(dest)
     except OSError:
         return None
@@ -126,7 +128,7 @@ def client_has_accepted_document(client_id: str, document_type: str) -> bool:
 def create_document_submission_from_upload(
     client_id: str,
     document_type: str,
-    file_bytes: bytes,
+    file: bytes | BinaryIO,
     filename: str,
     loa_id: str | None = None,
     project_root: Path | None = None,
@@ -134,6 +136,9 @@ def create_document_submission_from_upload(
     """
     Save uploaded file to data/uploads, create DocumentSubmission row, return info for UI.
 
+    file may be raw bytes or a readable binary file object (e.g. Streamlit UploadedFile);
+    file objects are streamed to disk in chunks rather than read into memory first.
+
     Returns:
         dict with document_id, file_path, client_id, document_type.
     """
@@ -144,7 +149,11 @@ def create_document_submission_from_upload(
     if ext and ext not in safe_name:
         safe_name = safe_name + ext
     file_path = upload_dir / f"{doc_id}_{safe_name}"
-    file_path.write_bytes(file_bytes)
+    if isinstance(file, (bytes, bytearray, memoryview)):
+        file_path.write_bytes(file)
+    else:
+        with file_path.open("wb") as out:
+            shutil.copyfileobj(file, out)
     # Store path as string (relative to project root or absolute)
     path_str = str(file_path)
 
@@ -7,9 +7,12 @@ proof of address, pension statements, investment valuations, etc.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import List
 
-from models.database import ClientProfile, DocumentSubmission, LOAWorkflow, session_scope
+from sqlalchemy.orm import Session
+
+from models.database import ClientProfile, DocumentSubmission, LOAWorkflow, session_or_scope, session_scope
 from orchestration.workflow_states import CASE_COMPLETE
 
 
@@ -50,8 +53,12 @@ def _doc_type_to_category_index(document_type: str) -> int | None:
     return DOCUMENT_TYPE_TO_CATEGORY.get(key)
 
 
+@lru_cache(maxsize=256)
 def document_type_to_category_label(document_type: str) -> str:
-    """Return human-readable fact-find category name for a document_type, or the document_type itself if not mapped."""
+    """
+    Return human-readable fact-find category name for a document_type, or the document_type itself if not mapped.
+    Cached: the category mapping is static at runtime.
+    """
     idx = _doc_type_to_category_index(document_type)
     if idx is not None:
         return FACT_FIND_CATEGORIES[idx]
@@ -61,13 +68,14 @@ def document_type_to_category_label(document_type: str) -> str:
 REQUIRED_FACT_FIND_COUNT = len(FACT_FIND_CATEGORIES)
 
 
-def get_fact_find_status(client_id: str) -> dict:
+def get_fact_find_status(client_id: str, db: Session | None = None) -> dict:
     """
     Return received/required counts and lists for partial submission status.
     Keys: received_count, required_count, missing_documents, received_categories.
+    If db is given the lookup runs on it; otherwise a new session is used.
     """
     received_indices: set[int] = set()
-    with session_scope() as db:
+    with session_or_scope(db) as db:
         docs = (
             db.query(DocumentSubmission.document_type)
             .filter(
@@ -108,16 +116,31 @@ def get_missing_fact_find_documents(client_id: str) -> List[str]:
     return get_fact_find_status(client_id)["missing_documents"]
 
 
+def has_fact_find_chase(clients_with_active_loa_only: bool = True) -> bool:
+    """
+    Cheap pre-check for get_fact_find_chase_queue: False when the queue is certainly empty
+    (no clients, or no clients with an active LOA). Issues a single SELECT ... LIMIT 1.
+    """
+    with session_scope() as db:
+        if clients_with_active_loa_only:
+            query = db.query(LOAWorkflow.loa_id).filter(LOAWorkflow.current_state != CASE_COMPLETE)
+        else:
+            query = db.query(ClientProfile.client_id)
+        return query.first() is not None
+
+
 def get_fact_find_chase_queue(
     limit: int | None = 50,
     clients_with_active_loa_only: bool = True,
+    db: Session | None = None,
 ) -> List[dict]:
     """
     Return list of clients who are missing at least one fact-find document.
     Each entry: client_id, client_name, missing_documents (list of str).
     Optionally restrict to clients that have at least one active (non-Complete) LOA.
+    If db is given all queries run on it; otherwise a new session is used.
     """
-    with session_scope() as db:
+    with session_or_scope(db) as db:
         if clients_with_active_loa_only:
             # Clients with at least one active LOA
             active_client_ids = {
@@ -138,7 +161,7 @@ def get_fact_find_chase_queue(
 
         queue: List[dict] = []
         for c in clients:
-            status = get_fact_find_status(c.client_id)
+            status = get_fact_find_status(c.client_id, db=db)
             missing = status["missing_documents"]
             if missing:
                 queue.append({
@@ -155,6 +178,20 @@ def get_fact_find_chase_queue(
     return queue
 
 
+def has_awaiting_verification() -> bool:
+    """Return True if any fact-find document is awaiting verification (single SELECT ... LIMIT 1)."""
+    with session_scope() as db:
+        row = (
+            db.query(DocumentSubmission.document_id)
+            .filter(
+                DocumentSubmission.loa_id.is_(None),
+                DocumentSubmission.processed_at.is_(None),
+            )
+            .first()
+        )
+        return row is not None
+
+
 def get_fact_find_documents_awaiting_verification(limit: int | None = 50) -> List[dict]:
     """
     Return fact-find documents (loa_id null) that have not yet been processed (processed_at null).
@@ -12,7 +12,7 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
-from models.database import LOAWorkflow, get_session
+from models.database import get_loa_with_client, get_session
 from utils.llm_helpers import chat_completion
 
 
@@ -39,7 +39,7 @@ def provider_communication_agent(state: Dict[str, Any]) -> Dict[str, Any]:
         return state
 
     with get_session() as db:
-        loa = db.query(LOAWorkflow).filter_by(loa_id=loa_id).first()
+        loa = get_loa_with_client(db, loa_id)
 
         if not loa:
             state["error"] = f"LOA {loa_id} not found"
@@ -11,7 +11,7 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
-from models.database import LOAWorkflow, session_scope
+from models.database import LOAWorkflow, get_loa_with_client, session_scope
 
 
 def provider_rpa_agent(state: Dict[str, Any]) -> Dict[str, Any]:
@@ -53,7 +53,7 @@ def provider_rpa_agent(state: Dict[str, Any]) -> Dict[str, Any]:
         return state
 
     with session_scope() as db:
-        loa = db.query(LOAWorkflow).filter_by(loa_id=loa_id).first()
+        loa = get_loa_with_client(db, loa_id)
         if not loa:
             state["rpa_success"] = False
             state["rpa_message"] = f"LOA {loa_id} not found"
@@ -32,11 +32,11 @@ def get_client_sentiment_for_priority(client_id: str) -> Tuple[str | None, float
     Get a single representative client sentiment for priority adjustment.
 
     Queries CommunicationLog for client_id and direction "Client to Advisor",
-    latest first (limit N). For rows missing sentiment, runs predict_sentiment
-    on message_text and persists to DB. Returns the latest (label, score).
+    latest first (limit N). For rows missing sentiment, runs predict_sentiment_batch
+    on their message_text and persists to DB. Returns the latest (label, score).
     """
     try:
-        from models.ml_models import predict_sentiment
+        from models.ml_models import predict_sentiment_batch
     except Exception:
         return (None, None)
 
@@ -54,15 +54,18 @@ def get_client_sentiment_for_priority(client_id: str) -> Tuple[str | None, float
         if not logs:
             return (None, None)
 
-        for log in logs:
-            if log.sentiment_label is not None and log.sentiment_score is not None:
-                continue
-            if not (log.message_text or "").strip():
-                continue
+        # Score every unscored message in one batched model call
+        unscored = [
+            log for log in logs
+            if (log.sentiment_label is None or log.sentiment_score is None)
+            and (log.message_text or "").strip()
+        ]
+        if unscored:
             try:
-                label, score = predict_sentiment(log.message_text.strip())
-                log.sentiment_label = label
-                log.sentiment_score = float(score)
+                predictions = predict_sentiment_batch([log.message_text.strip() for log in unscored])
+                for log, (label, score) in zip(unscored, predictions):
+                    log.sentiment_label = label
+                    log.sentiment_score = float(score)
             except (FileNotFoundError, Exception):
                 pass
         db.commit()
@@ -12,11 +12,18 @@ The CORE BRAIN of the system.
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from collections import defaultdict
 
-from agents.fact_find_chasing import get_fact_find_status, get_missing_fact_find_documents
+from sqlalchemy import Numeric, and_, case, cast, func, or_, update
+from sqlalchemy.orm import Session
+
+from agents.fact_find_chasing import (
+    get_fact_find_chase_queue,
+    get_fact_find_status,
+    get_missing_fact_find_documents,
+)
 from agents.sentiment_for_priority import (
     apply_sentiment_to_priority,
     get_client_sentiment_for_priority,
@@ -27,7 +34,9 @@ from models.database import (
     DocumentSubmission,
     LOAWorkflow,
     PostAdviceItem,
+    get_loa_with_client,
     get_session,
+    session_or_scope,
     session_scope,
 )
 from models.ml_models import calculate_priority_score
@@ -35,11 +44,13 @@ from orchestration.workflow_states import (
     AWAITING_CLIENT_SIGNATURE,
     CASE_COMPLETE,
     CLIENT_CHASE_STATES,
+    CLIENT_CHASE_STATES_TUPLE,
     CLIENT_DOCUMENTS_REJECTED,
     DOCUMENT_AWAITING_VERIFICATION,
     LINK_DOCUMENT_ALLOWED_STATES,
     MARK_PROVIDER_INFO_RECEIVED_ALLOWED,
     PROVIDER_CHASE_STATES,
+    PROVIDER_CHASE_STATES_TUPLE,
     PROVIDER_INFO_RECEIVED_NOTIFY_CLIENT,
     PROVIDER_RESPONSE_INCOMPLETE,
     SIGNED_LOA_READY_FOR_PROVIDER,
@@ -73,7 +84,7 @@ def workflow_orchestrator_agent(state: Dict[str, Any]) -> Dict[str, Any]:
     
     # Get LOA from database
     with session_scope() as db:
-        loa = db.query(LOAWorkflow).filter_by(loa_id=loa_id).first()
+        loa = get_loa_with_client(db, loa_id)
         
         if not loa:
             state["error"] = f"LOA {loa_id} not found"
@@ -204,6 +215,7 @@ def _chase_type_for_state(current_state: str) -> str:
 def get_priority_queue(
     limit: Optional[int] = 10,
     chase_type: Optional[str] = None,
+    db: Session | None = None,
 ) -> List[Dict[str, Any]]:
     """
     Get top priority LOAs that need action today.
@@ -214,39 +226,87 @@ def get_priority_queue(
         limit: Maximum number of items to return; None for no limit (all active LOAs).
         chase_type: If "client", only LOAs needing client action. If "provider", only LOAs needing provider action.
                     None for all active LOAs.
+        db: Optional session to run on; otherwise a new session is used.
 
     Returns:
         List of LOA dicts with priority info and chase_type.
     """
-    with session_scope() as db:
+    with session_or_scope(db) as db:
         query = (
             db.query(LOAWorkflow)
             .filter(LOAWorkflow.current_state != CASE_COMPLETE)
             .order_by(LOAWorkflow.priority_score.desc())
         )
         if chase_type == "client":
-            query = query.filter(LOAWorkflow.current_state.in_(CLIENT_CHASE_STATES))
+            query = query.filter(LOAWorkflow.current_state.in_(CLIENT_CHASE_STATES_TUPLE))
         elif chase_type == "provider":
-            query = query.filter(LOAWorkflow.current_state.in_(PROVIDER_CHASE_STATES))
+            query = query.filter(LOAWorkflow.current_state.in_(PROVIDER_CHASE_STATES_TUPLE))
         if limit is not None:
             query = query.limit(limit)
-        loas = query.all()
+        return [_priority_item(loa) for loa in query.all()]
 
-        results = []
-        for loa in loas:
-            ct = _chase_type_for_state(loa.current_state)
-            results.append({
-                "loa_id": loa.loa_id,
-                "client_name": loa.client.name if loa.client else "Unknown",
-                "provider": loa.provider,
-                "current_state": loa.current_state,
-                "priority_score": round(loa.priority_score, 2),
-                "days_in_state": loa.days_in_current_state,
-                "sla_days_remaining": loa.sla_days_remaining,
-                "needs_intervention": loa.needs_advisor_intervention,
-                "chase_type": ct,
-            })
-        return results
+
+def _priority_item(loa: LOAWorkflow) -> Dict[str, Any]:
+    """Priority-queue row for one LOA (shared by the full queue and keyset pages)."""
+    return {
+        "loa_id": loa.loa_id,
+        "client_id": loa.client_id,
+        "client_name": loa.client.name if loa.client else "Unknown",
+        "provider": loa.provider,
+        "current_state": loa.current_state,
+        "priority_score": round(loa.priority_score, 2),
+        "days_in_state": loa.days_in_current_state,
+        "sla_days_remaining": loa.sla_days_remaining,
+        "needs_intervention": loa.needs_advisor_intervention,
+        "chase_type": _chase_type_for_state(loa.current_state),
+    }
+
+
+PriorityCursor = Tuple[float, str]
+
+
+def get_priority_queue_page(
+    after: Optional[PriorityCursor] = None,
+    limit: int = 20,
+    chase_type: Optional[str] = None,
+    db: Session | None = None,
+) -> Tuple[List[Dict[str, Any]], Optional[PriorityCursor]]:
+    """
+    One page of active LOAs ordered by priority_score desc, loa_id asc (keyset pagination).
+
+    Args:
+        after: Cursor returned with the previous page; None for the first page.
+        limit: Page size.
+        chase_type: "client", "provider" or None, as for get_priority_queue.
+        db: Optional session to run on; otherwise a new session is used.
+
+    Returns:
+        (items, next_cursor). next_cursor is None when this is the last page. The cursor
+        holds the unrounded score, so pass it back as-is rather than rebuilding it from items.
+    """
+    with session_or_scope(db) as db:
+        query = db.query(LOAWorkflow).filter(LOAWorkflow.current_state != CASE_COMPLETE)
+        if chase_type == "client":
+            query = query.filter(LOAWorkflow.current_state.in_(CLIENT_CHASE_STATES_TUPLE))
+        elif chase_type == "provider":
+            query = query.filter(LOAWorkflow.current_state.in_(PROVIDER_CHASE_STATES_TUPLE))
+        if after is not None:
+            last_score, last_loa_id = after
+            query = query.filter(
+                or_(
+                    LOAWorkflow.priority_score < last_score,
+                    and_(LOAWorkflow.priority_score == last_score, LOAWorkflow.loa_id > last_loa_id),
+                )
+            )
+        loas = (
+            query.order_by(LOAWorkflow.priority_score.desc(), LOAWorkflow.loa_id.asc())
+            .limit(limit + 1)
+            .all()
+        )
+        has_more = len(loas) > limit
+        loas = loas[:limit]
+        next_cursor = (loas[-1].priority_score, loas[-1].loa_id) if has_more else None
+        return [_priority_item(loa) for loa in loas], next_cursor
 
 
 def update_workflow_state(loa_id: str, new_state: str) -> bool:
@@ -282,37 +342,43 @@ def update_workflow_state(loa_id: str, new_state: str) -> bool:
         return True
 
 
-def tick_loa_time() -> int:
+def tick_loa_time(db: Session | None = None) -> int:
     """
     Advance time for all active LOAs: increment days_in_current_state by 1,
     decrement sla_days_remaining by 1 (allow negative for overdue).
     Call at the start of each chaser run.
+    Issued as a single bulk UPDATE (NULL sla_days_remaining stays NULL).
+    If db is given the caller commits; otherwise a new session is committed on exit.
     Returns count of LOAs updated.
     """
-    with session_scope() as db:
-        loas = db.query(LOAWorkflow).filter(LOAWorkflow.current_state != CASE_COMPLETE).all()
-        for loa in loas:
-            loa.days_in_current_state = (loa.days_in_current_state or 0) + 1
-            if loa.sla_days_remaining is not None:
-                loa.sla_days_remaining = loa.sla_days_remaining - 1
-            loa.updated_at = datetime.utcnow()
-        db.commit()
-        return len(loas)
+    with session_or_scope(db) as session:
+        result = session.execute(
+            update(LOAWorkflow)
+            .where(LOAWorkflow.current_state != CASE_COMPLETE)
+            .values(
+                days_in_current_state=func.coalesce(LOAWorkflow.days_in_current_state, 0) + 1,
+                sla_days_remaining=LOAWorkflow.sla_days_remaining - 1,
+                updated_at=datetime.utcnow(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
 
 
-def persist_escalation(loa_id: str) -> bool:
+def persist_escalation(loa_id: str, db: Session | None = None) -> bool:
     """
     Set needs_advisor_intervention and escalated_at for an LOA (used by autonomic chaser).
+    If db is given the change is flushed and the caller commits.
     Returns True if updated, False if LOA not found.
     """
-    with session_scope() as db:
-        loa = db.query(LOAWorkflow).filter_by(loa_id=loa_id).first()
+    with session_or_scope(db) as session:
+        loa = session.query(LOAWorkflow).filter_by(loa_id=loa_id).first()
         if not loa:
             return False
         loa.needs_advisor_intervention = True
         loa.escalated_at = datetime.utcnow()
         loa.updated_at = datetime.utcnow()
-        db.commit()
+        session.flush()
         return True
 
 
@@ -366,7 +432,7 @@ def get_loa_detail(loa_id: str) -> Dict[str, Any] | None:
     Returns a single dict (no ORM); None if LOA not found.
     """
     with session_scope() as db:
-        loa = db.query(LOAWorkflow).filter_by(loa_id=loa_id).first()
+        loa = get_loa_with_client(db, loa_id)
         if not loa:
             return None
         client = loa.client
@@ -430,12 +496,23 @@ def get_loa_detail(loa_id: str) -> Dict[str, Any] | None:
 POST_ADVICE_COMPLETED_STATE = "Completed"
 
 
-def get_post_advice_chase_queue(limit: int | None = 50) -> List[Dict[str, Any]]:
+def has_post_advice_chase() -> bool:
+    """Return True if any post-advice item is not Completed (single SELECT ... LIMIT 1)."""
+    with session_scope() as db:
+        row = (
+            db.query(PostAdviceItem.item_id)
+            .filter(PostAdviceItem.current_state != POST_ADVICE_COMPLETED_STATE)
+            .first()
+        )
+        return row is not None
+
+
+def get_post_advice_chase_queue(limit: int | None = 50, db: Session | None = None) -> List[Dict[str, Any]]:
     """
     Return post-advice items that need chasing (not Completed).
     Order by days_until_deadline asc (nulls last), then days_outstanding desc.
     """
-    with session_scope() as db:
+    with session_or_scope(db) as db:
         query = (
             db.query(PostAdviceItem)
             .filter(PostAdviceItem.current_state != POST_ADVICE_COMPLETED_STATE)
@@ -462,12 +539,12 @@ def get_post_advice_chase_queue(limit: int | None = 50) -> List[Dict[str, Any]]:
     return result
 
 
-def get_client_list() -> List[Dict[str, Any]]:
+def get_client_list(db: Session | None = None) -> List[Dict[str, Any]]:
     """
     List all clients with pending LOA counts and stage breakdown, plus pending document count.
     For dashboard client table.
     """
-    with session_scope() as db:
+    with session_or_scope(db) as db:
         clients = db.query(ClientProfile).order_by(ClientProfile.name).all()
         result = []
         for c in clients:
@@ -547,12 +624,12 @@ def get_client_detail(client_id: str) -> Dict[str, Any] | None:
         }
 
 
-def get_provider_list() -> List[Dict[str, Any]]:
+def get_provider_list(db: Session | None = None) -> List[Dict[str, Any]]:
     """
     List distinct providers with pending LOA counts and stage breakdown.
     For dashboard provider table.
     """
-    with session_scope() as db:
+    with session_or_scope(db) as db:
         rows = db.query(LOAWorkflow.provider).distinct().all()
         providers = [r[0] for r in rows if r[0]]
         result = []
@@ -573,6 +650,92 @@ def get_provider_list() -> List[Dict[str, Any]]:
         return result
 
 
+# Dashboard KPI thresholds and priority-score legend buckets (upper bound exclusive, last inclusive)
+HIGH_PRIORITY_SCORE = 7
+SLA_AT_RISK_DAYS = 2
+PRIORITY_BUCKETS: tuple[tuple[str, float, float], ...] = (
+    ("Low (0–2)", 0, 2),
+    ("Medium (2–5)", 2, 5),
+    ("High (5–7)", 5, 7),
+    ("Critical (7–10)", 7, 10),
+)
+
+
+def _count_where(condition: Any) -> Any:
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+def get_dashboard_aggregates(db: Session | None = None) -> Dict[str, Any]:
+    """
+    KPI aggregates over active LOAs, computed in SQL so no LOA rows are loaded.
+
+    Keys: total, high_priority, sla_at_risk, needs_intervention, by_state (count per
+    current_state), by_chase_type (client/provider/other counts), priority_buckets
+    (count per PRIORITY_BUCKETS label). Scores are compared rounded to 2 dp, as shown in the queue.
+    """
+    # Cast first: PostgreSQL has no round(double precision, integer)
+    score = func.round(cast(LOAWorkflow.priority_score, Numeric), 2)
+    last_label = PRIORITY_BUCKETS[-1][0]
+    bucket_cols = [
+        _count_where(and_(score >= low, score <= high if label == last_label else score < high))
+        for label, low, high in PRIORITY_BUCKETS
+    ]
+    with session_or_scope(db) as db:
+        active = LOAWorkflow.current_state != CASE_COMPLETE
+        totals = db.query(
+            func.count(LOAWorkflow.loa_id),
+            _count_where(score >= HIGH_PRIORITY_SCORE),
+            _count_where(LOAWorkflow.sla_days_remaining <= SLA_AT_RISK_DAYS),
+            _count_where(LOAWorkflow.needs_advisor_intervention.is_(True)),
+            *bucket_cols,
+        ).filter(active).one()
+        state_rows = (
+            db.query(LOAWorkflow.current_state, func.count(LOAWorkflow.loa_id))
+            .filter(active)
+            .group_by(LOAWorkflow.current_state)
+            .all()
+        )
+    by_state = {state or "Unknown": n for state, n in state_rows}
+    by_chase_type: Dict[str, int] = defaultdict(int)
+    for state, n in state_rows:
+        by_chase_type[_chase_type_for_state(state)] += n
+    total, high_priority, sla_at_risk, needs_intervention, *buckets = totals
+    return {
+        "total": total,
+        "high_priority": high_priority,
+        "sla_at_risk": sla_at_risk,
+        "needs_intervention": needs_intervention,
+        "by_state": by_state,
+        "by_chase_type": dict(by_chase_type),
+        "priority_buckets": {label: n for (label, _, _), n in zip(PRIORITY_BUCKETS, buckets)},
+    }
+
+
+def get_dashboard_bundle(
+    fact_find_limit: int | None = 50,
+    post_advice_limit: int | None = 50,
+    queue_page_size: int = 20,
+) -> Dict[str, Any]:
+    """
+    Everything the dashboard lists on one page load, fetched on a single session/connection.
+
+    Keys: aggregates (get_dashboard_aggregates), client_queue and provider_queue
+    (first keyset page of queue_page_size per chase_type), fact_find, post_advice, clients, providers.
+    """
+    with session_scope() as db:
+        client_queue, _ = get_priority_queue_page(limit=queue_page_size, chase_type="client", db=db)
+        provider_queue, _ = get_priority_queue_page(limit=queue_page_size, chase_type="provider", db=db)
+        return {
+            "aggregates": get_dashboard_aggregates(db=db),
+            "client_queue": client_queue,
+            "provider_queue": provider_queue,
+            "fact_find": get_fact_find_chase_queue(limit=fact_find_limit, db=db),
+            "post_advice": get_post_advice_chase_queue(limit=post_advice_limit, db=db),
+            "clients": get_client_list(db=db),
+            "providers": get_provider_list(db=db),
+        }
+
+
 def get_provider_detail(provider: str) -> Dict[str, Any] | None:
     """Provider name plus list of LOAs for that provider for detail panel."""
     with session_scope() as db:
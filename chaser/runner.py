@@ -6,168 +6,264 @@ then fact-find chase and post-advice chase.
 from __future__ import annotations
 
 import logging
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
 
-from agents.client_comms import client_communication_agent
-from agents.document_processing import document_processing_agent
 from agents.fact_find_chasing import (
     document_type_to_category_label,
     get_fact_find_chase_queue,
     get_fact_find_documents_awaiting_verification,
+    has_awaiting_verification,
+    has_fact_find_chase,
 )
 from agents.workflow_orchestrator import (
     get_post_advice_chase_queue,
+    has_post_advice_chase,
     persist_escalation,
     tick_loa_time,
 )
-from models.database import LOAWorkflow, session_scope
-from orchestration import get_chaser_graph, initial_state
+from models.database import LOAWorkflow, session_or_scope, session_scope
+from orchestration import initial_state
 from orchestration.workflow_states import CASE_COMPLETE
 
 logger = logging.getLogger(__name__)
 
-PROVIDER_ACTIONS = (
+PROVIDER_ACTIONS = frozenset({
     "provider_follow_up",
     "provider_urgent_follow_up",
     "provider_clarification",
-)
-CLIENT_ACTIONS = ("client_communication", "client_notification")
+})
+CLIENT_ACTIONS = frozenset({"client_communication", "client_notification"})
 
 FACT_FIND_QUEUE_LIMIT = 50
 POST_ADVICE_QUEUE_LIMIT = 50
 FACT_FIND_VERIFICATION_LIMIT = 50
+ACTIVE_LOA_FETCH_SIZE = 100
 
 
-def _get_active_loa_ids(skip_escalated: bool = True) -> List[str]:
-    """Return loa_ids for LOAs that are not Complete and optionally not escalated."""
-    with session_scope() as db:
-        q = db.query(LOAWorkflow.loa_id).filter(LOAWorkflow.current_state != CASE_COMPLETE)
+def _get_active_loa_ids(skip_escalated: bool = True, db: Session | None = None) -> Iterator[str]:
+    """
+    Yield loa_ids for LOAs that are not Complete and optionally not escalated.
+    Rows are streamed from a server-side cursor in chunks of ACTIVE_LOA_FETCH_SIZE,
+    so the caller can start processing before the whole result set is fetched.
+    """
+    with session_or_scope(db) as session:
+        q = session.query(LOAWorkflow.loa_id).filter(LOAWorkflow.current_state != CASE_COMPLETE)
         if skip_escalated:
             q = q.filter(LOAWorkflow.escalated_at.is_(None))
-        return [row[0] for row in q.all()]
+        q = q.execution_options(stream_results=True).yield_per(ACTIVE_LOA_FETCH_SIZE)
+        for row in q:
+            yield row[0]
 
 
-def run_chaser_cycle(skip_escalated: bool = True) -> None:
-    """
-    Run one chaser cycle: (1) tick time for all active LOAs,
-    (2) for each active (and non-escalated) LOA invoke the graph,
-    (3) if result is escalate_to_advisor, persist escalation and skip provider chase;
-    (4) if result is a provider action, the graph already ran provider_comms — just log.
-    """
-    updated = tick_loa_time()
-    logger.info("tick_loa_time updated %s LOAs", updated)
+# Result of processing one queue entry: (ok, error message, exception) — the last two only when not ok
+EntryResult = Tuple[bool, Optional[str], Optional[BaseException]]
 
-    loa_ids = _get_active_loa_ids(skip_escalated=skip_escalated)
-    if loa_ids:
-        graph = get_chaser_graph()
-        for loa_id in loa_ids:
-            try:
-                result = graph.invoke(initial_state(loa_id=loa_id))
-                next_action = (result.get("next_action") or "").strip()
 
-                if next_action == "escalate_to_advisor":
-                    if persist_escalation(loa_id):
-                        logger.info("Escalated LOA %s to advisor", loa_id)
-                    continue
-
-                if next_action in PROVIDER_ACTIONS:
-                    logger.info(
-                        "Chaser ran provider action %s for LOA %s",
-                        next_action,
-                        loa_id,
-                    )
-                if next_action in CLIENT_ACTIONS:
-                    logger.info(
-                        "Chaser ran client action %s for LOA %s",
-                        next_action,
-                        loa_id,
-                    )
-            except Exception as e:
-                logger.exception("Chaser cycle failed for LOA %s: %s", loa_id, e)
-    else:
-        logger.info("No active LOAs to chase")
+def _run_factfind_entry(entry: Dict[str, Any]) -> EntryResult:
+    """Send a fact-find document request for one fact-find chase queue entry."""
+    from agents.client_comms import client_communication_agent
 
-    # Fact-find phase: chase clients missing fact-find documents
-    fact_find_queue = get_fact_find_chase_queue(limit=FACT_FIND_QUEUE_LIMIT)
-    for entry in fact_find_queue:
-        try:
-            state = {
-                "client_id": entry["client_id"],
-                "communication_type": "fact_find_document_request",
-                "context": {"missing_documents": entry["missing_documents"]},
-            }
-            client_communication_agent(state)
+    try:
+        state = {
+            "client_id": entry["client_id"],
+            "communication_type": "fact_find_document_request",
+            "context": {"missing_documents": entry["missing_documents"]},
+        }
+        client_communication_agent(state)
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
                 "Chaser sent fact-find document request to client %s (%s)",
                 entry["client_id"],
                 entry["client_name"],
+                extra={"client_id": entry["client_id"], "action": "fact_find_document_request"},
             )
-        except Exception as e:
-            logger.exception(
-                "Fact-find chase failed for client %s: %s",
-                entry.get("client_id"),
-                e,
-            )
+        return True, None, None
+    except Exception as e:
+        return False, f"Fact-find chase failed for client {entry.get('client_id')}: {e}", e
 
-    # Post-advice phase: chase outstanding post-advice items
-    post_advice_queue = get_post_advice_chase_queue(limit=POST_ADVICE_QUEUE_LIMIT)
-    for entry in post_advice_queue:
-        try:
-            state = {
-                "client_id": entry["client_id"],
-                "communication_type": "post_advice_reminder",
-                "context": {
-                    "item_type": entry["item_type"],
-                    "days_outstanding": entry["days_outstanding"],
-                    "deadline_days": entry.get("days_until_deadline") or 14,
-                },
-            }
-            client_communication_agent(state)
+
+def _run_postadvice_entry(entry: Dict[str, Any]) -> EntryResult:
+    """Send a post-advice reminder for one post-advice chase queue entry."""
+    from agents.client_comms import client_communication_agent
+
+    try:
+        state = {
+            "client_id": entry["client_id"],
+            "communication_type": "post_advice_reminder",
+            "context": {
+                "item_type": entry["item_type"],
+                "days_outstanding": entry["days_outstanding"],
+                "deadline_days": entry.get("days_until_deadline") or 14,
+            },
+        }
+        client_communication_agent(state)
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
                 "Chaser sent post-advice reminder for item %s (client %s)",
                 entry["item_id"],
                 entry["client_id"],
+                extra={"client_id": entry["client_id"], "item_id": entry["item_id"], "action": "post_advice_reminder"},
             )
-        except Exception as e:
-            logger.exception(
-                "Post-advice chase failed for item %s: %s",
-                entry.get("item_id"),
-                e,
-            )
+        return True, None, None
+    except Exception as e:
+        return False, f"Post-advice chase failed for item {entry.get('item_id')}: {e}", e
 
-    # Fact-find document verification phase: run OCR/validation on submitted fact-find docs; on failure chase with reason
-    awaiting_verification = get_fact_find_documents_awaiting_verification(limit=FACT_FIND_VERIFICATION_LIMIT)
-    for entry in awaiting_verification:
-        try:
-            state = {
-                "document_id": entry["document_id"],
+
+def _run_verify_entry(entry: Dict[str, Any]) -> EntryResult:
+    """Verify one submitted fact-find document; on failed validation chase the client with the reason."""
+    from agents.client_comms import client_communication_agent
+    from agents.document_processing import document_processing_agent
+
+    try:
+        state = {
+            "document_id": entry["document_id"],
+            "client_id": entry["client_id"],
+            "run_ocr": True,
+        }
+        state = document_processing_agent(state)
+        if state.get("error"):
+            logger.warning("Fact-find doc verification failed for %s: %s", entry["document_id"], state["error"])
+            return True, None, None
+        if not state.get("validation_passed", False):
+            category_label = document_type_to_category_label(entry["document_type"])
+            client_communication_agent({
                 "client_id": entry["client_id"],
-                "run_ocr": True,
-            }
-            state = document_processing_agent(state)
-            if state.get("error"):
-                logger.warning("Fact-find doc verification failed for %s: %s", entry["document_id"], state["error"])
-                continue
-            if not state.get("validation_passed", False):
-                category_label = document_type_to_category_label(entry["document_type"])
-                client_communication_agent({
-                    "client_id": entry["client_id"],
-                    "communication_type": "document_request",
-                    "context": {
-                        "missing_documents": [category_label],
-                        "quality_issues": state.get("quality_issues") or "",
-                        "message": "Document did not pass verification. Please resubmit.",
-                    },
-                })
+                "communication_type": "document_request",
+                "context": {
+                    "missing_documents": [category_label],
+                    "quality_issues": state.get("quality_issues") or "",
+                    "message": "Document did not pass verification. Please resubmit.",
+                },
+            })
+            if logger.isEnabledFor(logging.INFO):
                 logger.info(
                     "Chaser sent document resubmit request for %s (client %s), reason: %s",
                     entry["document_id"],
                     entry["client_id"],
                     state.get("quality_issues", ""),
+                    extra={"client_id": entry["client_id"], "document_id": entry["document_id"], "action": "document_request"},
                 )
-        except Exception as e:
-            logger.exception(
-                "Fact-find document verification failed for %s: %s",
-                entry.get("document_id"),
-                e,
-            )
+        return True, None, None
+    except Exception as e:
+        return False, f"Fact-find document verification failed for {entry.get('document_id')}: {e}", e
+
+
+def _fetch_queue(
+    has_entries: Callable[[], bool],
+    fetch: Callable[..., List[Dict[str, Any]]],
+    limit: int,
+) -> List[Dict[str, Any]]:
+    """Fetch one queue, skipping the full query when the cheap LIMIT 1 pre-check finds nothing."""
+    if not has_entries():
+        return []
+    return fetch(limit=limit)
+
+
+def _fetch_all_queues() -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Fetch the fact-find chase, post-advice chase and awaiting-verification queues
+    concurrently (one session per worker thread), so the cycle pays one DB round trip
+    of latency instead of three.
+    """
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        fact_find = pool.submit(_fetch_queue, has_fact_find_chase, get_fact_find_chase_queue, FACT_FIND_QUEUE_LIMIT)
+        post_advice = pool.submit(_fetch_queue, has_post_advice_chase, get_post_advice_chase_queue, POST_ADVICE_QUEUE_LIMIT)
+        verification = pool.submit(
+            _fetch_queue,
+            has_awaiting_verification,
+            get_fact_find_documents_awaiting_verification,
+            FACT_FIND_VERIFICATION_LIMIT,
+        )
+        return fact_find.result(), post_advice.result(), verification.result()
+
+
+def _log_failures(results: Iterable[EntryResult]) -> None:
+    """Log every failed entry result in a single pass, with the traceback of the exception."""
+    for ok, err_msg, exc in results:
+        if not ok:
+            logger.error(err_msg, exc_info=exc)
+
+
+def _handle_escalation(loa_id: str, next_action: str) -> None:
+    """
+    Persist escalation to the advisor (provider chase is skipped for this LOA).
+    Uses its own short session so the write lock is released before the next LOA's graph run.
+    """
+    if persist_escalation(loa_id) and logger.isEnabledFor(logging.INFO):
+        logger.info("Escalated LOA %s to advisor", loa_id, extra={"loa_id": loa_id, "action": next_action})
+
+
+def _log_action(kind: str, loa_id: str, next_action: str) -> None:
+    """Log a per-LOA action with structured fields; skips record construction when INFO is disabled."""
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Chaser ran %s action %s for LOA %s",
+            kind,
+            next_action,
+            loa_id,
+            extra={"loa_id": loa_id, "action": next_action},
+        )
+
+
+def _log_provider_action(loa_id: str, next_action: str) -> None:
+    """The graph already ran provider_comms/provider_rpa — just log."""
+    _log_action("provider", loa_id, next_action)
+
+
+def _log_client_action(loa_id: str, next_action: str) -> None:
+    """The graph already ran client comms — just log."""
+    _log_action("client", loa_id, next_action)
+
+
+# next_action -> handler(loa_id, next_action); actions not listed need no follow-up
+ACTION_HANDLERS: Dict[str, Callable[[str, str], None]] = {
+    "escalate_to_advisor": _handle_escalation,
+    **dict.fromkeys(PROVIDER_ACTIONS, _log_provider_action),
+    **dict.fromkeys(CLIENT_ACTIONS, _log_client_action),
+}
+
+
+def run_chaser_cycle(skip_escalated: bool = True) -> None:
+    """
+    Run one chaser cycle: (1) tick time for all active LOAs,
+    (2) for each active (and non-escalated) LOA invoke the graph,
+    (3) if result is escalate_to_advisor, persist escalation and skip provider chase;
+    (4) if result is a provider action, the graph already ran provider_comms — just log.
+    """
+    # One session for the tick and the active-LOA stream. Graph nodes, escalations and the
+    # queue phases below use their own short sessions so no write lock is held across the loop.
+    with session_scope() as db:
+        updated = tick_loa_time(db=db)
+        db.commit()  # graph nodes read and update the ticked rows from their own sessions
+        logger.info("tick_loa_time updated %s LOAs", updated)
+
+        invoke = None
+        for loa_id in _get_active_loa_ids(skip_escalated=skip_escalated, db=db):
+            if invoke is None:
+                from orchestration.state_graph import get_chaser_graph
+
+                invoke = get_chaser_graph().invoke
+            try:
+                result = invoke(initial_state(loa_id=loa_id))
+                next_action = (result.get("next_action") or "").strip()
+                handler = ACTION_HANDLERS.get(next_action)
+                if handler is not None:
+                    handler(loa_id, next_action)
+            except Exception as e:
+                logger.exception("Chaser cycle failed for LOA %s: %s", loa_id, e)
+        if invoke is None:
+            logger.info("No active LOAs to chase")
+
+    fact_find_queue, post_advice_queue, awaiting_verification = _fetch_all_queues()
+
+    # Fact-find phase: chase clients missing fact-find documents
+    _log_failures(map(_run_factfind_entry, fact_find_queue))
+
+    # Post-advice phase: chase outstanding post-advice items
+    _log_failures(map(_run_postadvice_entry, post_advice_queue))
+
+    # Fact-find document verification phase: run OCR/validation on submitted fact-find docs; on failure chase with reason
+    _log_failures(map(_run_verify_entry, awaiting_verification))
@@ -7,34 +7,33 @@ functions; render_* functions use st.* and must be called in a Streamlit context
 
 from __future__ import annotations
 
-from typing import Any, Generator
-
+import asyncio
+import logging
+import queue
+import threading
+import time
+from functools import lru_cache
+from itertools import islice
+from typing import Any, AsyncGenerator, BinaryIO, Callable, Generator
+
+import pandas as pd
 import streamlit as st
 
-from agents.predictive_intelligence import predictive_intelligence_agent
-from agents.client_comms import client_communication_agent
-from agents.document_processing import document_processing_agent
 from agents.document_upload import (
     client_has_accepted_document,
     create_document_submission_from_upload,
     UPLOAD_DOCUMENT_TYPES,
 )
-from agents.fact_find_chasing import (
-    document_type_to_category_label,
-    get_fact_find_chase_queue,
-)
+from agents.fact_find_chasing import document_type_to_category_label
 from agents.workflow_orchestrator import (
     get_client_detail,
-    get_client_list,
+    get_dashboard_bundle,
     get_loa_detail,
-    get_post_advice_chase_queue,
-    get_priority_queue,
     get_provider_detail,
-    get_provider_list,
     link_document_to_loa,
     mark_provider_info_received,
 )
-from orchestration import get_chaser_graph, initial_state
+from orchestration import initial_state
 from orchestration.workflow_states import (
     CASE_COMPLETE,
     CLIENT_DOCUMENTS_REJECTED,
@@ -42,6 +41,8 @@ from orchestration.workflow_states import (
     MARK_PROVIDER_INFO_RECEIVED_ALLOWED,
 )
 
+logger = logging.getLogger(__name__)
+
 # Priority queue table: internal keys and display headers (order preserved)
 PRIORITY_QUEUE_COLS = [
     "loa_id",
@@ -76,6 +77,35 @@ COLUMN_HELP: dict[str, str] = {
     "needs_intervention": "Flag set when the case needs advisor attention (e.g. priority > 7 or SLA overdue).",
 }
 
+# Column configs are constant; build once at import instead of on every rerun
+# (internal_key, display_label) pairs per table, precomputed so builders never look labels up per cell
+PRIORITY_QUEUE_PAIRS: tuple[tuple[str, str], ...] = tuple((k, COLUMN_LABELS[k]) for k in PRIORITY_QUEUE_COLS)
+PRIORITY_QUEUE_COLUMN_CONFIG: dict[str, Any] = {
+    label: st.column_config.Column(label, help=COLUMN_HELP[k])
+    for k, label in PRIORITY_QUEUE_PAIRS
+}
+
+# Upload document-type choices (constant filters of UPLOAD_DOCUMENT_TYPES, computed once)
+_LOA_UPLOAD_ALLOWED = frozenset({
+    "Passport", "Driving Licence", "Utility Bill", "Bank Statement", "Council Tax",
+    "Pension Statement", "Investment Statement", "Payslip", "P60",
+})
+LOA_UPLOAD_TYPES: tuple[str, ...] = tuple(t for t in UPLOAD_DOCUMENT_TYPES if t in _LOA_UPLOAD_ALLOWED)
+_FACT_FIND_UPLOAD_EXCLUDED = frozenset({
+    "Provider response", "Application Form", "Risk Questionnaire", "AML Verification",
+    "Authority to Proceed", "Annual Review",
+})
+FACT_FIND_UPLOAD_TYPES: tuple[str, ...] = tuple(t for t in UPLOAD_DOCUMENT_TYPES if t not in _FACT_FIND_UPLOAD_EXCLUDED)
+
+# TTL (seconds) for the st.cache_data-backed predictive insight
+INSIGHT_CACHE_TTL_SECONDS = 300
+# LOA/client/provider detail lookups; cleared on every UI write (clear_detail_caches)
+DETAIL_CACHE_TTL_SECONDS = 30
+# Queue/list fetches behind every rerun; cleared explicitly on writes, TTL covers the background chaser
+QUEUE_CACHE_TTL_SECONDS = 30
+# How often the fact-find live log polls its background upload/OCR job
+UPLOAD_POLL_SECONDS = 0.5
+
 # Display names for graph nodes (for pipeline and steps list)
 NODE_DISPLAY_NAMES: dict[str, str] = {
     "orchestrator": "Orchestrator",
@@ -87,119 +117,252 @@ NODE_DISPLAY_NAMES: dict[str, str] = {
 }
 
 
-def format_step_summary(node_name: str, update: dict[str, Any]) -> str:
-    """Return a short human-readable summary of what this step produced (node-specific)."""
-    if update.get("error"):
-        return f"Error: {update['error'][:100]}"
-    node = (node_name or "").strip().lower()
-    # Orchestrator: next_action, priority_score, client
-    if "orchestrator" in node:
-        parts: list[str] = []
-        if "next_action" in update:
-            parts.append(f"Set next_action to **{update['next_action']}**")
-        if "priority_score" in update:
-            parts.append(f"priority_score {update['priority_score']}")
-        if "client_name" in update:
-            parts.append(f"client: {update['client_name']}")
-        if "current_state" in update:
-            parts.append(f"workflow state: {update['current_state']}")
-        return "; ".join(parts) if parts else "Orchestrator ran."
-    # Client comms (prepare_client + client_communication_agent)
-    if "client" in node and "comms" in node:
-        msg = update.get("generated_message") or update.get("message_text")
-        comm_type = update.get("communication_type", "")
-        if msg:
-            return f"Generated client message ({len(str(msg))} chars)" + (
-                f"; type: {comm_type}" if comm_type else ""
-            )
-        return f"communication_type: {comm_type}" if comm_type else "Client communication prepared."
-    # Provider comms
-    if "provider" in node and "comms" in node:
-        msg = update.get("generated_message")
-        if msg:
-            return f"Drafted provider message ({len(str(msg))} chars)."
-        return "Provider communication drafted."
-    # Provider RPA
-    if "rpa" in node or "provider rpa" in node:
-        success = update.get("rpa_success")
-        rpa_msg = (update.get("rpa_message") or "")[:80]
-        if success is not None:
-            return f"rpa_success: {success}; {rpa_msg}" if rpa_msg else f"rpa_success: {success}."
-        return rpa_msg or "Provider RPA step completed."
-    # Document processing
-    if "document processing" in node or "document_processing" in node:
-        v = update.get("validation_passed")
-        if v is not None:
-            return f"validation_passed: {v}; quality_issues: {update.get('quality_issues', '') or '—'}"
-        return "Document verification ran."
-    # Post document verification
-    if "post document" in node or "post_document" in node:
-        return "Updated LOA state; route to client if failed."
-    # Fallback: key fields
-    parts = []
-    if "next_action" in update:
-        parts.append(f"next_action: {update['next_action']}")
-    if "priority_score" in update:
-        parts.append(f"priority_score: {update['priority_score']}")
+@st.cache_resource(show_spinner=False)
+def _chaser_graph():
+    """Compiled chaser graph, built once per process (cache_resource: shared, not pickled/hashed)."""
+    from orchestration.state_graph import get_chaser_graph
+
+    return get_chaser_graph()
+
+
+# Distinguishes "key missing" from "key present but falsy" in a single dict lookup
+_SENTINEL = object()
+
+
+def _message_len(update: dict[str, Any]) -> int:
+    """Length of the generated/client message in this update, 0 if none."""
     msg = update.get("generated_message") or update.get("message_text")
+    return len(msg) if isinstance(msg, str) else len(str(msg)) if msg else 0
+
+
+def _summarize_orchestrator(update: dict[str, Any]) -> str:
+    """Orchestrator: next_action, priority_score, client."""
+    parts: list[str] = []
+    get = update.get
+    if (na := get("next_action", _SENTINEL)) is not _SENTINEL:
+        parts.append(f"Set next_action to **{na}**")
+    if (score := get("priority_score", _SENTINEL)) is not _SENTINEL:
+        parts.append(f"priority_score {score}")
+    if (name := get("client_name", _SENTINEL)) is not _SENTINEL:
+        parts.append(f"client: {name}")
+    if (state := get("current_state", _SENTINEL)) is not _SENTINEL:
+        parts.append(f"workflow state: {state}")
+    return "; ".join(parts) if parts else "Orchestrator ran."
+
+
+def _summarize_client_comms(update: dict[str, Any]) -> str:
+    """Client comms (prepare_client + client_communication_agent)."""
+    msg_len = _message_len(update)
+    comm_type = update.get("communication_type", "")
+    if msg_len:
+        return f"Generated client message ({msg_len} chars)" + (
+            f"; type: {comm_type}" if comm_type else ""
+        )
+    return f"communication_type: {comm_type}" if comm_type else "Client communication prepared."
+
+
+def _summarize_provider_comms(update: dict[str, Any]) -> str:
+    msg = update.get("generated_message")
     if msg:
-        parts.append(f"message ({len(str(msg))} chars)")
-    if "rpa_success" in update:
-        parts.append(f"rpa_success: {update['rpa_success']}")
+        return f"Drafted provider message ({len(str(msg))} chars)."
+    return "Provider communication drafted."
+
+
+def _summarize_provider_rpa(update: dict[str, Any]) -> str:
+    success = update.get("rpa_success")
+    rpa_msg = (update.get("rpa_message") or "")[:80]
+    if success is not None:
+        return f"rpa_success: {success}; {rpa_msg}" if rpa_msg else f"rpa_success: {success}."
+    return rpa_msg or "Provider RPA step completed."
+
+
+def _summarize_document_processing(update: dict[str, Any]) -> str:
+    v = update.get("validation_passed")
+    if v is not None:
+        return f"validation_passed: {v}; quality_issues: {update.get('quality_issues', '') or '—'}"
+    return "Document verification ran."
+
+
+def _summarize_post_document_verification(update: dict[str, Any]) -> str:
+    return "Updated LOA state; route to client if failed."
+
+
+def _summarize_generic(update: dict[str, Any]) -> str:
+    """Fallback for unknown nodes: key fields."""
+    parts = []
+    get = update.get
+    if (na := get("next_action", _SENTINEL)) is not _SENTINEL:
+        parts.append(f"next_action: {na}")
+    if (score := get("priority_score", _SENTINEL)) is not _SENTINEL:
+        parts.append(f"priority_score: {score}")
+    msg_len = _message_len(update)
+    if msg_len:
+        parts.append(f"message ({msg_len} chars)")
+    if (rpa := get("rpa_success", _SENTINEL)) is not _SENTINEL:
+        parts.append(f"rpa_success: {rpa}")
     if not parts:
-        keys = [k for k in list(update.keys())[:5] if not k.startswith("_")]
+        keys = [k for k in islice(update, 5) if not k.startswith("_")]
         parts.append(", ".join(keys) if keys else "—")
     return "; ".join(parts)
 
 
+# Summarizer per canonical node token (the raw graph node name)
+_SUMMARIZERS: dict[str, Any] = {
+    "orchestrator": _summarize_orchestrator,
+    "prepare_client": _summarize_client_comms,
+    "provider_comms": _summarize_provider_comms,
+    "provider_rpa": _summarize_provider_rpa,
+    "document_processing": _summarize_document_processing,
+    "post_document_verification": _summarize_post_document_verification,
+}
+
+# Raw node names, display names and their lowercase forms -> canonical node token
+_NODE_CANONICAL: dict[str, str] = {
+    alias: raw
+    for raw, display in NODE_DISPLAY_NAMES.items()
+    for alias in (raw, display, display.lower())
+}
+_NODE_CANONICAL.update({"client_comms": "prepare_client", "client comms": "prepare_client"})
+
+
+def _canonical_node(node: str) -> str | None:
+    """Map an unrecognised, already-normalized node name to a canonical token by substring."""
+    if "orchestrator" in node:
+        return "orchestrator"
+    if "client" in node and "comms" in node:
+        return "prepare_client"
+    if "provider" in node and "comms" in node:
+        return "provider_comms"
+    if "rpa" in node:
+        return "provider_rpa"
+    if "document processing" in node or "document_processing" in node:
+        return "document_processing"
+    if "post document" in node or "post_document" in node:
+        return "post_document_verification"
+    return None
+
+
+def format_step_summary(node_name: str, update: dict[str, Any]) -> str:
+    """Return a short human-readable summary of what this step produced (node-specific)."""
+    if err := update.get("error"):
+        return f"Error: {err[:100]}"
+    canonical = _NODE_CANONICAL.get(node_name)
+    if canonical is None:
+        # Unknown spelling: normalize once, then fall back to substring matching
+        canonical = _canonical_node((node_name or "").strip().lower())
+    return _SUMMARIZERS.get(canonical, _summarize_generic)(update)
+
+
+def _step_updates(chunk: Any) -> Generator[tuple[str, str, dict[str, Any]], None, None]:
+    """(raw_name, display_name, update) for each node update in one stream_mode="updates" chunk."""
+    if not isinstance(chunk, dict):
+        return
+    for raw_name, update in chunk.items():
+        if isinstance(update, dict):
+            yield raw_name, NODE_DISPLAY_NAMES.get(raw_name, raw_name.replace("_", " ").title()), update
+
+
+def _fold_updates(state: dict[str, Any], updates_log: list[dict[str, Any]]) -> dict[str, Any]:
+    final_state: dict[str, Any] = dict(state)
+    for update in updates_log:
+        final_state.update(update)
+    return final_state
+
+
+def _log_workflow_exception(location: str, last_yielded: str | None) -> None:
+    """Log the exception being handled, with the last node that produced a step; call from an except block."""
+    logger.exception("Workflow stream failed in %s (last step: %s)", location, last_yielded)
+
+
 def run_workflow_with_steps(loa_id: str) -> Generator[tuple[str, dict[str, Any]], None, None]:
     """
     Stream the chaser workflow and yield (node_display_name, update) for each step.
-    After the stream ends, the caller can use the accumulated state (merged from all updates)
-    as the final result. Yields ("__final__", final_state) as the last item so the UI can
+    Only deltas are kept while streaming; once the stream ends they are folded onto the
+    initial state and ("__final__", final_state) is yielded as the last item so the UI can
     call render_workflow_result(final_state). On exception, yields ("__error__", {"error": "..."}).
     """
     last_yielded: str | None = None
     try:
-        graph = get_chaser_graph()
+        graph = _chaser_graph()
         state = initial_state(loa_id=loa_id)
-        accumulated: dict[str, Any] = dict(state)
-        stream = graph.stream(accumulated, stream_mode="updates")
-        for chunk in stream:
-            if not isinstance(chunk, dict):
-                continue
-            for raw_name, update in chunk.items():
-                if not isinstance(update, dict):
-                    continue
-                display_name = NODE_DISPLAY_NAMES.get(raw_name, raw_name.replace("_", " ").title())
-                accumulated.update(update)
+        updates_log: list[dict[str, Any]] = []
+        for chunk in graph.stream(state, stream_mode="updates"):
+            for raw_name, display_name, update in _step_updates(chunk):
+                updates_log.append(update)
                 last_yielded = raw_name
                 yield (display_name, update)
-        yield ("__final__", accumulated)
+        yield ("__final__", _fold_updates(state, updates_log))
     except Exception as e:
-        # #region agent log
-        import os
-        import traceback
-        try:
-            log_path = r"c:\agentic-chaser\.cursor\debug.log"
-            os.makedirs(os.path.dirname(log_path), exist_ok=True)
-            tb = traceback.format_exc()
-            with open(log_path, "a", encoding="utf-8") as f:
-                f.write(
-                    '{"location":"components.run_workflow_with_steps","message":"exception","data":{"error":'
-                    + repr(str(e)[:200])
-                    + ',"last_yielded":'
-                    + repr(last_yielded)
-                    + ',"traceback":'
-                    + repr(tb[:2000])
-                    + '},"hypothesisId":"H1"}\n'
-                )
-        except Exception:
-            pass
-        # #endregion
+        _log_workflow_exception("run_workflow_with_steps", last_yielded)
+        yield ("__error__", {"error": str(e)})
+
+
+async def run_workflow_with_steps_async(loa_id: str) -> AsyncGenerator[tuple[str, dict[str, Any]], None]:
+    """Async twin of run_workflow_with_steps over graph.astream; same items, same "__final__"/"__error__" tail."""
+    last_yielded: str | None = None
+    try:
+        graph = _chaser_graph()
+        state = initial_state(loa_id=loa_id)
+        updates_log: list[dict[str, Any]] = []
+        async for chunk in graph.astream(state, stream_mode="updates"):
+            for raw_name, display_name, update in _step_updates(chunk):
+                updates_log.append(update)
+                last_yielded = raw_name
+                yield (display_name, update)
+        yield ("__final__", _fold_updates(state, updates_log))
+    except Exception as e:
+        _log_workflow_exception("run_workflow_with_steps_async", last_yielded)
         yield ("__error__", {"error": str(e)})
 
 
+def pump_workflow_steps(loa_id: str) -> Generator[tuple[str, dict[str, Any]], None, None]:
+    """
+    Drive run_workflow_with_steps_async from synchronous Streamlit code on a private event loop,
+    one step per run_until_complete, so the script thread is not parked on a sync stream iterator.
+    """
+    loop = asyncio.new_event_loop()
+    steps = run_workflow_with_steps_async(loa_id)
+    try:
+        while True:
+            step = loop.run_until_complete(anext(steps, _SENTINEL))
+            if step is _SENTINEL:
+                break
+            yield step
+    finally:
+        loop.run_until_complete(steps.aclose())
+        loop.close()
+
+
+def run_workflow_step_batches(
+    loa_id: str,
+    batch_window_ms: int = 50,
+    max_batch: int = 8,
+) -> Generator[list[tuple[str, dict[str, Any]]], None, None]:
+    """
+    Coalesce pump_workflow_steps into batches so the UI re-renders once per batch.
+    A batch is flushed when batch_window_ms has elapsed since the last flush, when
+    max_batch steps are buffered, or on "__final__" / "__error__" (always last in its batch).
+    """
+    window = batch_window_ms / 1000.0
+    batch: list[tuple[str, dict[str, Any]]] = []
+    last_flush = time.monotonic()
+    for step in pump_workflow_steps(loa_id):
+        batch.append(step)
+        now = time.monotonic()
+        if step[0] in ("__final__", "__error__") or len(batch) >= max_batch or now - last_flush >= window:
+            yield batch
+            batch = []
+            last_flush = now
+    if batch:
+        yield batch
+
+
+def format_step_line(idx: int, name: str, update: dict[str, Any]) -> str:
+    """One numbered markdown line for a workflow step: agent reasoning, else the step summary."""
+    reasoning = update.get("reasoning") or format_step_summary(name, update)
+    return f"{idx}. **{name}** — {reasoning}"
+
+
 def run_workflow(loa_id: str) -> dict[str, Any]:
     """
     Run the chaser workflow graph for the given LOA.
@@ -208,7 +371,7 @@ def run_workflow(loa_id: str) -> dict[str, Any]:
     On exception, returns a dict with an "error" key.
     """
     try:
-        graph = get_chaser_graph()
+        graph = _chaser_graph()
         state = initial_state(loa_id=loa_id)
         result = graph.invoke(state)
         return dict(result) if hasattr(result, "keys") else result
@@ -216,26 +379,92 @@ def run_workflow(loa_id: str) -> dict[str, Any]:
         return {"error": str(e)}
 
 
+@st.cache_data(ttl=INSIGHT_CACHE_TTL_SECONDS, show_spinner=False)
 def get_predictive_insight(loa_id: str) -> dict[str, Any]:
-    """Return predictive intelligence state for the LOA (insight_summary, delay_risk, recommended_action)."""
-    try:
-        return predictive_intelligence_agent({"loa_id": loa_id})
-    except Exception as e:
-        return {"error": str(e)}
+    """
+    Return predictive intelligence state for the LOA (insight_summary, delay_risk, recommended_action).
+    Cached per loa_id for INSIGHT_CACHE_TTL_SECONDS so reruns do not re-invoke the agent/LLM.
+    Exceptions propagate (st.cache_data does not memoise them), so callers must catch.
+    """
+    from agents.predictive_intelligence import predictive_intelligence_agent
 
+    return predictive_intelligence_agent({"loa_id": loa_id})
 
-def render_dashboard_kpis_and_charts(items: list[dict[str, Any]]) -> None:
-    """Render KPI metrics row. Uses full list for aggregates."""
-    if not items:
+
+@st.cache_data(ttl=DETAIL_CACHE_TTL_SECONDS, show_spinner=False)
+def get_loa_detail_cached(loa_id: str) -> dict[str, Any] | None:
+    return get_loa_detail(loa_id)
+
+
+@st.cache_data(ttl=DETAIL_CACHE_TTL_SECONDS, show_spinner=False)
+def _client_detail_cached(client_id: str) -> dict[str, Any] | None:
+    return get_client_detail(client_id)
+
+
+@st.cache_data(ttl=DETAIL_CACHE_TTL_SECONDS, show_spinner=False)
+def _provider_detail_cached(provider: str) -> dict[str, Any] | None:
+    return get_provider_detail(provider)
+
+
+def clear_detail_caches() -> None:
+    """Drop cached LOA/client/provider details; call after a mutation and before st.rerun()."""
+    get_loa_detail_cached.clear()
+    _client_detail_cached.clear()
+    _provider_detail_cached.clear()
+
+
+@st.cache_data(ttl=QUEUE_CACHE_TTL_SECONDS, show_spinner=False)
+def get_dashboard_bundle_cached() -> dict[str, Any]:
+    """
+    All dashboard queues and lists (see get_dashboard_bundle), fetched on one connection and
+    cached so reruns and every tab read the same snapshot without requerying.
+    Each list item also gets a "display" label for selectboxes, built once per fetch.
+    """
+    bundle = get_dashboard_bundle()
+    for key in ("client_queue", "provider_queue"):
+        for x in bundle[key]:
+            x["display"] = f"{x['loa_id']} — {x.get('client_name', '')} ({x.get('provider', '')})"
+    for x in bundle["fact_find"]:
+        x["display"] = f"{x['client_id']} — {x.get('client_name', '')}"
+    for x in bundle["post_advice"]:
+        x["display"] = f"{x['item_id']} — {x.get('client_name', '')} — {x.get('item_type', '')}"
+    for x in bundle["clients"]:
+        x["display"] = f"{x['client_id']} — {x['name']}"
+    return bundle
+
+
+def get_dashboard_bundle_for_session() -> dict[str, Any]:
+    """
+    Per-session memo over get_dashboard_bundle_cached. st.cache_data hands back a fresh copy on
+    every call, so tabs read the bundle from st.session_state instead; it is refetched when the
+    session's data version changes (see clear_data_caches) or after QUEUE_CACHE_TTL_SECONDS.
+    """
+    version = st.session_state.get("_data_version", 0)
+    memo = st.session_state.get("_dashboard_bundle")
+    now = time.monotonic()
+    if memo is not None and memo[0] == version and now - memo[1] < QUEUE_CACHE_TTL_SECONDS:
+        return memo[2]
+    bundle = get_dashboard_bundle_cached()
+    st.session_state["_dashboard_bundle"] = (version, now, bundle)
+    return bundle
+
+
+def clear_data_caches() -> None:
+    """Drop cached queues, lists and details; call after any write (status change, upload, link, data load)."""
+    st.session_state["_data_version"] = st.session_state.get("_data_version", 0) + 1
+    get_dashboard_bundle_cached.clear()
+    clear_detail_caches()
+
+
+def render_dashboard_kpis_and_charts(aggregates: dict[str, Any]) -> None:
+    """Render KPI metrics row from get_dashboard_aggregates (counts computed in SQL)."""
+    total = aggregates.get("total", 0)
+    if not total:
         st.caption("No active cases — KPIs will appear when you have LOAs not yet Case Complete.")
         return
-    total = len(items)
-    high_priority = sum(1 for x in items if (x.get("priority_score") or 0) >= 7)
-    sla_at_risk = sum(
-        1 for x in items
-        if x.get("sla_days_remaining") is not None and x.get("sla_days_remaining") <= 2
-    )
-    needs_intervention = sum(1 for x in items if x.get("needs_intervention"))
+    high_priority = aggregates.get("high_priority", 0)
+    sla_at_risk = aggregates.get("sla_at_risk", 0)
+    needs_intervention = aggregates.get("needs_intervention", 0)
 
     col1, col2, col3, col4 = st.columns(4)
     with col1:
@@ -248,19 +477,56 @@ def render_dashboard_kpis_and_charts(items: list[dict[str, Any]]) -> None:
         st.metric("Needs intervention", needs_intervention)
 
 
-def build_priority_queue_table(items: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+def _records_frame(items: list[dict[str, Any]], pairs: tuple[tuple[str, str], ...]) -> pd.DataFrame:
+    """Project items onto the pair keys in one DataFrame build, then set display labels (nullable dtypes keep ints as ints)."""
+    df = pd.DataFrame(items, columns=[k for k, _ in pairs])
+    df.columns = [label for _, label in pairs]
+    return df.convert_dtypes()
+
+
+def build_priority_queue_table(items: list[dict[str, Any]]) -> tuple[pd.DataFrame, dict[str, Any]]:
     """
     Build (rows, column_config) for the priority queue table so the app can render
     st.dataframe(..., selection_mode="single-row", on_select="rerun") and read selection.
-    Returns ([], {}) when items is empty.
+    Returns (empty DataFrame, {}) when items is empty.
     """
     if not items:
-        return [], {}
-    rows = [{COLUMN_LABELS[k]: x.get(k) for k in PRIORITY_QUEUE_COLS if k in x} for x in items]
-    column_config = {
-        COLUMN_LABELS[k]: st.column_config.Column(COLUMN_LABELS[k], help=COLUMN_HELP[k])
-        for k in PRIORITY_QUEUE_COLS
-    }
+        return pd.DataFrame(), {}
+    return _records_frame(items, PRIORITY_QUEUE_PAIRS), PRIORITY_QUEUE_COLUMN_CONFIG
+
+
+def build_priority_queue_table_cached(
+    items: list[dict[str, Any]], cache_key: str = "_pq_cache"
+) -> tuple[pd.DataFrame, dict[str, Any]]:
+    """
+    build_priority_queue_table memoized in st.session_state[cache_key]: when the displayed
+    fields of items are unchanged since the last rerun, the previous (rows, column_config)
+    is reused instead of rebuilt.
+    """
+    digest = hash(tuple(tuple(x.get(k) for k in PRIORITY_QUEUE_COLS) for x in items))
+    cached = st.session_state.get(cache_key)
+    if cached is not None and cached[0] == digest:
+        return cached[1], cached[2]
+    rows, column_config = build_priority_queue_table(items)
+    st.session_state[cache_key] = (digest, rows, column_config)
+    return rows, column_config
+
+
+def build_table_cached(
+    items: list[Any],
+    builder: Callable[[list[Any]], tuple[Any, dict[str, Any]]],
+    cache_key: str,
+) -> tuple[Any, dict[str, Any]]:
+    """
+    builder(items) memoized in st.session_state[cache_key] on the identity of items. Lists from
+    get_dashboard_bundle_for_session are the same objects until the bundle is refetched, so
+    reruns reuse the built table without hashing rows; the memo holds items, so the id cannot be reused.
+    """
+    cached = st.session_state.get(cache_key)
+    if cached is not None and cached[0] is items:
+        return cached[1], cached[2]
+    rows, column_config = builder(items)
+    st.session_state[cache_key] = (items, rows, column_config)
     return rows, column_config
 
 
@@ -269,7 +535,7 @@ def render_priority_queue(items: list[dict[str, Any]]) -> None:
     if not items:
         st.info("No LOAs needing action. Use **Load test data** in the sidebar to load sample data.")
         return
-    rows, column_config = build_priority_queue_table(items)
+    rows, column_config = build_priority_queue_table_cached(items)
     st.dataframe(
         rows,
         column_config=column_config,
@@ -278,9 +544,31 @@ def render_priority_queue(items: list[dict[str, Any]]) -> None:
     )
 
 
+# Client attributes shown in the LOA and client detail panels, in display order
+CLIENT_DETAIL_FIELDS: tuple[str, ...] = (
+    "name",
+    "age",
+    "employment_type",
+    "annual_income",
+    "existing_pensions_count",
+    "risk_profile",
+    "communication_preference",
+    "document_responsiveness",
+)
+
+
+def _client_fields_frame(record: dict[str, Any], keys: tuple[str, ...]) -> pd.DataFrame:
+    """Two-column Field/Value frame so client attributes render as one st.table element."""
+    values = [record.get(k) for k in keys]
+    return pd.DataFrame({
+        "Field": [k.replace("_", " ").title() for k in keys],
+        "Value": [str(v) if v is not None else "—" for v in values],
+    }).set_index("Field")
+
+
 def render_loa_detail_panel(loa_id: str, show_link_document: bool = False) -> None:
     """Show task description, column details with explanations, client details, and detailed status."""
-    detail = get_loa_detail(loa_id)
+    detail = get_loa_detail_cached(loa_id)
     if detail is None:
         st.warning("LOA not found.")
         return
@@ -293,12 +581,17 @@ def render_loa_detail_panel(loa_id: str, show_link_document: bool = False) -> No
     )
     st.caption("Task summary")
 
+    _render_loa_column_details(detail, client_name)
+    _render_loa_client_details(client)
+    _render_loa_detailed_status(loa_id, detail, show_link_document)
+
+
+def _render_loa_column_details(detail: dict[str, Any], client_name: str) -> None:
     with st.expander("Column details", expanded=True):
         pb = detail.get("priority_breakdown") or {}
         sla_days = detail.get("sla_days") or 15
         sla_remaining = detail.get("sla_days_remaining")
-        for k in PRIORITY_QUEUE_COLS:
-            label = COLUMN_LABELS[k]
+        for k, label in PRIORITY_QUEUE_PAIRS:
             if k == "client_name":
                 val = client_name
             elif k == "loa_id":
@@ -331,18 +624,20 @@ def render_loa_detail_panel(loa_id: str, show_link_document: bool = False) -> No
                 val = detail.get(k, "")
             st.markdown(f"**{label}**: {val}")
 
+
+def _render_loa_client_details(client: dict[str, Any]) -> None:
     with st.expander("Client details", expanded=False):
-        c1, c2 = st.columns(2)
-        with c1:
-            for key in ("name", "age", "employment_type", "annual_income", "existing_pensions_count"):
-                v = client.get(key)
-                st.text(f"{key.replace('_', ' ').title()}: {v if v is not None else '—'}")
-        with c2:
-            for key in ("risk_profile", "communication_preference", "document_responsiveness"):
-                v = client.get(key)
-                st.text(f"{key.replace('_', ' ').title()}: {v if v is not None else '—'}")
+        st.table(_client_fields_frame(client, CLIENT_DETAIL_FIELDS))
 
+
+@st.fragment
+def _render_loa_detailed_status(loa_id: str, detail: dict[str, Any], show_link_document: bool) -> None:
+    """
+    Status plus the mark/upload/link actions. Runs as a fragment so widget interactions
+    here (document type, file, document choice) rerun only this block, not the whole page.
+    """
     with st.expander("Detailed status", expanded=False):
+        sla_days = detail.get("sla_days") or 15
         state = detail.get("current_state", "")
         days = detail.get("days_in_current_state", 0)
         remaining = detail.get("sla_days_remaining")
@@ -363,6 +658,7 @@ def render_loa_detail_panel(loa_id: str, show_link_document: bool = False) -> No
         if state in MARK_PROVIDER_INFO_RECEIVED_ALLOWED:
             if st.button("Mark provider info received", key=f"mark_info_{loa_id}"):
                 if mark_provider_info_received(loa_id):
+                    clear_data_caches()
                     st.success("State set to Provider Info Received - Notify Client.")
                     st.rerun()
                 else:
@@ -371,19 +667,19 @@ def render_loa_detail_panel(loa_id: str, show_link_document: bool = False) -> No
             client_id = detail.get("client_id")
             if client_id:
                 st.markdown("**Upload document**")
-                loa_upload_types = [t for t in UPLOAD_DOCUMENT_TYPES if t in ("Passport", "Driving Licence", "Utility Bill", "Bank Statement", "Council Tax", "Pension Statement", "Investment Statement", "Payslip", "P60")]
-                upload_doc_type = st.selectbox("Document type", loa_upload_types, key=f"loa_upload_type_{loa_id}")
+                upload_doc_type = st.selectbox("Document type", LOA_UPLOAD_TYPES, key=f"loa_upload_type_{loa_id}")
                 upload_file = st.file_uploader("File (PDF or image)", type=["pdf", "png", "jpg", "jpeg"], key=f"loa_upload_file_{loa_id}")
                 if st.button("Upload and link to LOA", key=f"loa_upload_btn_{loa_id}") and upload_file:
                     try:
                         info = create_document_submission_from_upload(
                             client_id=client_id,
                             document_type=upload_doc_type,
-                            file_bytes=upload_file.read(),
+                            file=upload_file,
                             filename=upload_file.name,
                             loa_id=loa_id,
                         )
                         if link_document_to_loa(info["document_id"], loa_id):
+                            clear_data_caches()
                             st.success("Document uploaded and linked. Run workflow to verify.")
                             st.rerun()
                         else:
@@ -392,7 +688,7 @@ def render_loa_detail_panel(loa_id: str, show_link_document: bool = False) -> No
                         st.error(f"Upload failed: {e}")
 
                 st.markdown("**Link existing document to LOA**")
-                client_data = get_client_detail(client_id)
+                client_data = _client_detail_cached(client_id)
                 doc_list = (client_data or {}).get("documents") or []
                 if doc_list:
                     doc_options = [f"{d.get('document_id', '')} — {d.get('document_type', '')}" for d in doc_list]
@@ -402,6 +698,7 @@ def render_loa_detail_panel(loa_id: str, show_link_document: bool = False) -> No
                         if doc_choice is not None and doc_choice < len(doc_ids):
                             doc_id = doc_ids[doc_choice]
                             if link_document_to_loa(doc_id, loa_id):
+                                clear_data_caches()
                                 st.success("Document linked. State set to Document Awaiting Verification; chaser will verify on next run.")
                                 st.rerun()
                             else:
@@ -428,23 +725,23 @@ CLIENT_TABLE_HELP = {
     "stages_summary": "Breakdown of pending LOAs by workflow state (e.g. Prepared: 2, Provider Submitted: 1).",
     "pending_documents": "Document submissions pending validation or manual review.",
 }
+CLIENT_TABLE_PAIRS: tuple[tuple[str, str], ...] = tuple((k, CLIENT_TABLE_LABELS[k]) for k in CLIENT_TABLE_COLS)
+CLIENT_TABLE_COLUMN_CONFIG: dict[str, Any] = {
+    label: st.column_config.Column(label, help=CLIENT_TABLE_HELP[k])
+    for k, label in CLIENT_TABLE_PAIRS
+}
 
 
-def build_client_table_data(items: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+def build_client_table_data(items: list[dict[str, Any]]) -> tuple[pd.DataFrame, dict[str, Any]]:
     """Build (rows, column_config) for the client table with row selection."""
     if not items:
-        return [], {}
-    rows = [{CLIENT_TABLE_LABELS[k]: x.get(k) for k in CLIENT_TABLE_COLS if k in x} for x in items]
-    column_config = {
-        CLIENT_TABLE_LABELS[k]: st.column_config.Column(CLIENT_TABLE_LABELS[k], help=CLIENT_TABLE_HELP[k])
-        for k in CLIENT_TABLE_COLS
-    }
-    return rows, column_config
+        return pd.DataFrame(), {}
+    return _records_frame(items, CLIENT_TABLE_PAIRS), CLIENT_TABLE_COLUMN_CONFIG
 
 
 def render_client_detail_panel(client_id: str) -> None:
     """Show full client profile, their LOAs by stage, and document submissions."""
-    detail = get_client_detail(client_id)
+    detail = _client_detail_cached(client_id)
     if detail is None:
         st.warning("Client not found.")
         return
@@ -452,15 +749,7 @@ def render_client_detail_panel(client_id: str) -> None:
     st.caption("Client summary")
 
     with st.expander("Profile", expanded=True):
-        c1, c2 = st.columns(2)
-        with c1:
-            for key in ("client_id", "name", "age", "employment_type", "annual_income", "existing_pensions_count"):
-                v = detail.get(key)
-                st.text(f"{key.replace('_', ' ').title()}: {v if v is not None else '—'}")
-        with c2:
-            for key in ("risk_profile", "communication_preference", "document_responsiveness"):
-                v = detail.get(key)
-                st.text(f"{key.replace('_', ' ').title()}: {v if v is not None else '—'}")
+        st.table(_client_fields_frame(detail, ("client_id",) + CLIENT_DETAIL_FIELDS))
 
     with st.expander("Pending LOAs by stage", expanded=True):
         st.caption(f"Total pending: {detail.get('pending_loas', 0)}")
@@ -468,15 +757,16 @@ def render_client_detail_panel(client_id: str) -> None:
         if not loas:
             st.caption("No LOAs.")
         else:
-            for loa in loas:
-                if loa.get("current_state") == CASE_COMPLETE:
-                    continue
-                st.markdown(
-                    f"**{loa.get('loa_id', '')}** — {loa.get('provider', '')} · "
-                    f"State: {loa.get('current_state', '')} · Priority: {loa.get('priority_score', '')} · "
-                    f"Days in state: {loa.get('days_in_current_state', 0)} · "
-                    f"SLA left: {loa.get('sla_days_remaining') if loa.get('sla_days_remaining') is not None else '—'}"
-                )
+            lines = [
+                f"- **{loa.get('loa_id', '')}** — {loa.get('provider', '')} · "
+                f"State: {loa.get('current_state', '')} · Priority: {loa.get('priority_score', '')} · "
+                f"Days in state: {loa.get('days_in_current_state', 0)} · "
+                f"SLA left: {loa.get('sla_days_remaining') if loa.get('sla_days_remaining') is not None else '—'}"
+                for loa in loas
+                if loa.get("current_state") != CASE_COMPLETE
+            ]
+            if lines:
+                st.markdown("\n".join(lines))
 
     with st.expander("Document submissions", expanded=False):
         st.caption(f"Pending (validation/review): {detail.get('pending_documents', 0)} of {len(detail.get('documents') or [])}")
@@ -484,12 +774,14 @@ def render_client_detail_panel(client_id: str) -> None:
         if not docs:
             st.caption("No document submissions.")
         else:
+            lines = []
             for d in docs:
                 status = "Pending" if (d.get("validation_passed") is False or d.get("manual_review_required") is True) else "OK"
-                st.markdown(
-                    f"**{d.get('document_id', '')}** — {d.get('document_type', '')} · "
+                lines.append(
+                    f"- **{d.get('document_id', '')}** — {d.get('document_type', '')} · "
                     f"Validation: {d.get('validation_passed')} · Manual review: {d.get('manual_review_required')} · {status}"
                 )
+            st.markdown("\n".join(lines))
 
     fact_find_status = detail.get("fact_find_status") or {}
     received_count = fact_find_status.get("received_count", 0)
@@ -501,21 +793,20 @@ def render_client_detail_panel(client_id: str) -> None:
             st.caption("All required fact-find document categories are satisfied.")
         else:
             st.caption("Chase client for these fact-find documents only:")
-            for doc in missing_ff:
-                st.markdown(f"- {doc}")
+            st.markdown("\n".join(f"- {doc}" for doc in missing_ff))
 
     post_advice = detail.get("post_advice_items") or []
     with st.expander("Post-advice items", expanded=bool(post_advice)):
         if not post_advice:
             st.caption("No post-advice items.")
         else:
-            for item in post_advice:
-                st.markdown(
-                    f"**{item.get('item_id', '')}** — {item.get('item_type', '')} · "
-                    f"State: {item.get('current_state', '')} · "
-                    f"Days outstanding: {item.get('days_outstanding', 0)} · "
-                    f"Days until deadline: {item.get('days_until_deadline') if item.get('days_until_deadline') is not None else '—'}"
-                )
+            st.markdown("\n".join(
+                f"- **{item.get('item_id', '')}** — {item.get('item_type', '')} · "
+                f"State: {item.get('current_state', '')} · "
+                f"Days outstanding: {item.get('days_outstanding', 0)} · "
+                f"Days until deadline: {item.get('days_until_deadline') if item.get('days_until_deadline') is not None else '—'}"
+                for item in post_advice
+            ))
 
 
 # Provider table: columns and help
@@ -530,23 +821,23 @@ PROVIDER_TABLE_HELP = {
     "pending_loas": "Number of LOAs with this provider not yet Case Complete.",
     "stages_summary": "Breakdown of pending LOAs by workflow state.",
 }
+PROVIDER_TABLE_PAIRS: tuple[tuple[str, str], ...] = tuple((k, PROVIDER_TABLE_LABELS[k]) for k in PROVIDER_TABLE_COLS)
+PROVIDER_TABLE_COLUMN_CONFIG: dict[str, Any] = {
+    label: st.column_config.Column(label, help=PROVIDER_TABLE_HELP[k])
+    for k, label in PROVIDER_TABLE_PAIRS
+}
 
 
-def build_provider_table_data(items: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+def build_provider_table_data(items: list[dict[str, Any]]) -> tuple[pd.DataFrame, dict[str, Any]]:
     """Build (rows, column_config) for the provider table with row selection."""
     if not items:
-        return [], {}
-    rows = [{PROVIDER_TABLE_LABELS[k]: x.get(k) for k in PROVIDER_TABLE_COLS if k in x} for x in items]
-    column_config = {
-        PROVIDER_TABLE_LABELS[k]: st.column_config.Column(PROVIDER_TABLE_LABELS[k], help=PROVIDER_TABLE_HELP[k])
-        for k in PROVIDER_TABLE_COLS
-    }
-    return rows, column_config
+        return pd.DataFrame(), {}
+    return _records_frame(items, PROVIDER_TABLE_PAIRS), PROVIDER_TABLE_COLUMN_CONFIG
 
 
 def render_provider_detail_panel(provider: str) -> None:
     """Show provider name and list of pending LOAs with client and stage."""
-    detail = get_provider_detail(provider)
+    detail = _provider_detail_cached(provider)
     if detail is None:
         st.warning("Provider not found.")
         return
@@ -558,13 +849,13 @@ def render_provider_detail_panel(provider: str) -> None:
         if not loas:
             st.caption("No pending LOAs.")
         else:
-            for loa in loas:
-                st.markdown(
-                    f"**{loa.get('loa_id', '')}** — {loa.get('client_name', '')} · "
-                    f"State: {loa.get('current_state', '')} · Priority: {loa.get('priority_score', '')} · "
-                    f"Days in state: {loa.get('days_in_current_state', 0)} · "
-                    f"SLA left: {loa.get('sla_days_remaining') if loa.get('sla_days_remaining') is not None else '—'}"
-                )
+            st.markdown("\n".join(
+                f"- **{loa.get('loa_id', '')}** — {loa.get('client_name', '')} · "
+                f"State: {loa.get('current_state', '')} · Priority: {loa.get('priority_score', '')} · "
+                f"Days in state: {loa.get('days_in_current_state', 0)} · "
+                f"SLA left: {loa.get('sla_days_remaining') if loa.get('sla_days_remaining') is not None else '—'}"
+                for loa in loas
+            ))
 
 
 FACT_FIND_QUEUE_COLS = ["client_id", "client_name", "received_required", "missing_documents"]
@@ -574,29 +865,36 @@ FACT_FIND_QUEUE_LABELS = {
     "received_required": "Received (of required)",
     "missing_documents": "Missing documents",
 }
+FACT_FIND_QUEUE_PAIRS: tuple[tuple[str, str], ...] = tuple((k, FACT_FIND_QUEUE_LABELS[k]) for k in FACT_FIND_QUEUE_COLS)
+FACT_FIND_QUEUE_COLUMN_CONFIG: dict[str, Any] = {
+    label: st.column_config.Column(label) for _, label in FACT_FIND_QUEUE_PAIRS
+}
+
+
+@lru_cache(maxsize=512)
+def _join_missing(docs: tuple[str, ...]) -> str:
+    """Comma-joined missing-document list; memoized since the same lists recur across reruns."""
+    return ", ".join(docs)
 
 
 def build_fact_find_queue_table(items: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], dict[str, Any]]:
     """Build (rows, column_config) for the fact-find chase queue. Shows X of Y received; missing_documents as comma-separated."""
     if not items:
         return [], {}
+    id_label, name_label, status_label, missing_label = (label for _, label in FACT_FIND_QUEUE_PAIRS)
     rows = []
     for x in items:
         rc = x.get("received_count")
         rq = x.get("required_count")
         status = f"{rc} / {rq}" if rc is not None and rq is not None else "—"
         row = {
-            FACT_FIND_QUEUE_LABELS["client_id"]: x.get("client_id"),
-            FACT_FIND_QUEUE_LABELS["client_name"]: x.get("client_name"),
-            FACT_FIND_QUEUE_LABELS["received_required"]: status,
-            FACT_FIND_QUEUE_LABELS["missing_documents"]: ", ".join(x.get("missing_documents") or []),
+            id_label: x.get("client_id"),
+            name_label: x.get("client_name"),
+            status_label: status,
+            missing_label: _join_missing(tuple(x.get("missing_documents") or ())),
         }
         rows.append(row)
-    column_config = {
-        FACT_FIND_QUEUE_LABELS[k]: st.column_config.Column(FACT_FIND_QUEUE_LABELS[k])
-        for k in FACT_FIND_QUEUE_COLS
-    }
-    return rows, column_config
+    return rows, FACT_FIND_QUEUE_COLUMN_CONFIG
 
 
 POST_ADVICE_QUEUE_COLS = ["item_id", "client_id", "client_name", "item_type", "current_state", "days_outstanding", "days_until_deadline"]
@@ -609,22 +907,21 @@ POST_ADVICE_QUEUE_LABELS = {
     "days_outstanding": "Days outstanding",
     "days_until_deadline": "Days to deadline",
 }
+POST_ADVICE_QUEUE_PAIRS: tuple[tuple[str, str], ...] = tuple((k, POST_ADVICE_QUEUE_LABELS[k]) for k in POST_ADVICE_QUEUE_COLS)
+POST_ADVICE_QUEUE_COLUMN_CONFIG: dict[str, Any] = {
+    label: st.column_config.Column(label) for _, label in POST_ADVICE_QUEUE_PAIRS
+}
 
 
-def build_post_advice_queue_table(items: list[dict[str, Any]]) -> tuple[list[dict[str, Any]], dict[str, Any]]:
+def build_post_advice_queue_table(items: list[dict[str, Any]]) -> tuple[pd.DataFrame, dict[str, Any]]:
     """Build (rows, column_config) for the post-advice chase queue."""
     if not items:
-        return [], {}
-    rows = [{POST_ADVICE_QUEUE_LABELS[k]: x.get(k) for k in POST_ADVICE_QUEUE_COLS if k in x} for x in items]
-    column_config = {
-        POST_ADVICE_QUEUE_LABELS[k]: st.column_config.Column(POST_ADVICE_QUEUE_LABELS[k])
-        for k in POST_ADVICE_QUEUE_COLS
-    }
-    return rows, column_config
+        return pd.DataFrame(), {}
+    return _records_frame(items, POST_ADVICE_QUEUE_PAIRS), POST_ADVICE_QUEUE_COLUMN_CONFIG
 
 
 def run_fact_find_upload_and_validate(
-    client_id: str, document_type: str, file_bytes: bytes, filename: str
+    client_id: str, document_type: str, file: bytes | BinaryIO, filename: str
 ) -> Generator[tuple[str, dict[str, Any] | None], None, None]:
     """
     Yield progress messages and final state for fact-find upload + OCR validation.
@@ -641,7 +938,7 @@ def run_fact_find_upload_and_validate(
         info = create_document_submission_from_upload(
             client_id=client_id,
             document_type=document_type,
-            file_bytes=file_bytes,
+            file=file,
             filename=filename,
             loa_id=None,
         )
@@ -650,6 +947,8 @@ def run_fact_find_upload_and_validate(
         return
     yield ("Document saved.", None)
     yield ("Running OCR and validation…", None)
+    from agents.document_processing import document_processing_agent
+
     state = document_processing_agent(
         {"document_id": info["document_id"], "run_ocr": True}
     )
@@ -675,8 +974,34 @@ def run_fact_find_upload_and_validate(
             yield (f"Validation failed: {issues}. You can generate a chase message below.", state)
 
 
+def start_fact_find_upload_and_validate(
+    client_id: str, document_type: str, file: bytes | BinaryIO, filename: str
+) -> queue.Queue:
+    """
+    Run run_fact_find_upload_and_validate on a daemon thread so OCR does not block the script thread.
+    Each (message, state) item is put on the returned queue, followed by None when the job ends.
+    The job makes no st.* calls, so it needs no script-run context. Pass bytes, not an
+    UploadedFile: the upload may be released by the next rerun.
+    """
+    progress: queue.Queue = queue.Queue()
+
+    def _worker() -> None:
+        try:
+            for item in run_fact_find_upload_and_validate(client_id, document_type, file, filename):
+                progress.put(item)
+        except Exception as e:
+            progress.put((f"Error: {e}", {"error": str(e)}))
+        finally:
+            progress.put(None)
+
+    threading.Thread(target=_worker, name="fact-find-upload", daemon=True).start()
+    return progress
+
+
 def run_fact_find_chase(client_id: str, client_name: str, missing_documents: list[str]) -> dict[str, Any]:
     """Run client_communication_agent for fact-find document request; return state with generated_message."""
+    from agents.client_comms import client_communication_agent
+
     state = {
         "client_id": client_id,
         "communication_type": "fact_find_document_request",
@@ -690,6 +1015,8 @@ def run_post_advice_chase(
     client_id: str, item_type: str, days_outstanding: int, days_until_deadline: int | None
 ) -> dict[str, Any]:
     """Run client_communication_agent for post-advice reminder; return state with generated_message."""
+    from agents.client_comms import client_communication_agent
+
     state = {
         "client_id": client_id,
         "communication_type": "post_advice_reminder",
@@ -12,6 +12,7 @@ from models.database import (
     engine,
     get_session,
     init_db,
+    session_or_scope,
     session_scope,
 )
 
@@ -25,5 +26,6 @@ __all__ = [
     "engine",
     "get_session",
     "init_db",
+    "session_or_scope",
     "session_scope",
 ]
\ No newline at end of file
@@ -11,9 +11,15 @@ Defines 5 core tables:
 
 from __future__ import annotations
 
+import atexit
+import csv
+import io
+import logging
+import queue
 from contextlib import contextmanager
 from datetime import datetime
-from typing import Iterator
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Iterator, List, Sequence
 
 from sqlalchemy import (
     Boolean,
@@ -21,26 +27,98 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    bindparam,
     create_engine,
+    event,
+    insert,
+    select,
     text,
 )
-from sqlalchemy.orm import Session, declarative_base, relationship, sessionmaker
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session, declarative_base, relationship, selectinload, sessionmaker
 
 from config.config import settings
 
 # ---------- Engine & Base ----------
 
+# One engine (and connection pool) per process; every session_scope borrows from it, so
+# Streamlit reruns reuse pooled connections instead of reconnecting. SQLite's default pools
+# do not take QueuePool sizing, so pool_size/max_overflow apply to server databases only.
+_POOL_SIZING = {} if settings.db.url.startswith("sqlite") else {
+    "pool_size": settings.db.pool_size,
+    "max_overflow": settings.db.max_overflow,
+}
+
+# Bulk INSERTs (see bulk_insert) are sent as multi-row VALUES batches of up to 1000 rows;
+# executemany_mode is a psycopg2-only option, so it is passed for that driver alone.
+_BULK_INSERT_OPTIONS: Dict[str, Any] = {"insertmanyvalues_page_size": 1000}
+if settings.db.url.startswith(("postgresql://", "postgresql+psycopg2://", "postgres://")):
+    _BULK_INSERT_OPTIONS["executemany_mode"] = "values_plus_batch"
+
+
+def init_sql_logging() -> None:
+    """
+    In debug mode, route SQL statement logging through a queue to a background writer thread.
+
+    Replaces create_engine(echo=...), which formats and writes every statement to stderr
+    synchronously on the querying thread. Outside debug mode the sqlalchemy.engine logger is
+    left untouched (no thread, normal propagation). Idempotent: the handler is attached once per process.
+    """
+    if not settings.app.debug:
+        return
+    sql_logger = logging.getLogger("sqlalchemy.engine")
+    sql_logger.setLevel(logging.INFO)
+    if any(isinstance(h, QueueHandler) for h in sql_logger.handlers):
+        return
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s %(message)s"))
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    sql_logger.addHandler(QueueHandler(log_queue))
+    # Statements are written by the listener; do not echo them again through the root handlers
+    sql_logger.propagate = False
+
+
+init_sql_logging()
+
 engine = create_engine(
     settings.db.url,
-    echo=settings.app.debug,
     pool_pre_ping=True,
+    pool_recycle=settings.db.pool_recycle,
+    **_POOL_SIZING,
+    **_BULK_INSERT_OPTIONS,
 )
 
+if engine.dialect.name == "sqlite":
+
+    @event.listens_for(engine, "connect")
+    def _sqlite_pragmas(dbapi_conn, _connection_record) -> None:
+        """WAL lets readers run alongside the writer; NORMAL skips the fsync on every commit (safe under WAL)."""
+        cur = dbapi_conn.cursor()
+        cur.execute("PRAGMA journal_mode=WAL")
+        cur.execute("PRAGMA synchronous=NORMAL")
+        cur.execute("PRAGMA temp_store=MEMORY")
+        cur.execute("PRAGMA mmap_size=268435456")
+        cur.close()
+
 Base = declarative_base()
 
+# Timestamps are filled in by the database (naive UTC, matching the datetime.utcnow() values the
+# agents write), so inserts/updates send no timestamp parameters. SQLite's CURRENT_TIMESTAMP is UTC;
+# PostgreSQL's now() follows the session time zone, so it is converted explicitly.
+# SQLite cannot add a DEFAULT to an existing column, so tables created before the server defaults
+# existed would get NULL timestamps; there the Python-side default is kept as well.
+_IS_SQLITE = settings.db.url.startswith("sqlite")
+_UTC_NOW_SQL = "CURRENT_TIMESTAMP" if _IS_SQLITE else "(now() AT TIME ZONE 'utc')"
+_UTC_NOW = text(_UTC_NOW_SQL)
+_PY_UTC_NOW = datetime.utcnow if _IS_SQLITE else None
+
 
 # ========== ORM MODELS ==========
 
@@ -60,8 +138,8 @@ class ClientProfile(Base):
     communication_preference = Column(String, default="Email")
     document_responsiveness = Column(String, nullable=True)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=_PY_UTC_NOW, server_default=_UTC_NOW)
+    updated_at = Column(DateTime, default=_PY_UTC_NOW, server_default=_UTC_NOW, onupdate=_UTC_NOW)
 
     # Relationships
     loa_workflows = relationship("LOAWorkflow", back_populates="client")
@@ -104,12 +182,18 @@ class LOAWorkflow(Base):
     escalated_at = Column(DateTime, nullable=True)
     pending_document_id = Column(String, nullable=True)  # document_id awaiting verification (no FK to avoid circular dependency)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=_PY_UTC_NOW, server_default=_UTC_NOW)
+    updated_at = Column(DateTime, default=_PY_UTC_NOW, server_default=_UTC_NOW, onupdate=_UTC_NOW)
 
     # Relationships
     client = relationship("ClientProfile", back_populates="loa_workflows")
 
+    # Queue/orchestrator picks filter on state and sort by priority; per-client lookups by client_id
+    __table_args__ = (
+        Index("ix_loa_state_priority", "current_state", "sla_overdue", "priority_score"),
+        Index("ix_loa_client_id", "client_id"),
+    )
+
 
 class DocumentSubmission(Base):
     """Document submission tracking with OCR/validation results."""
@@ -131,12 +215,17 @@ class DocumentSubmission(Base):
 
     file_path = Column(String, nullable=True)
 
-    submitted_at = Column(DateTime, default=datetime.utcnow)
+    submitted_at = Column(DateTime, default=_PY_UTC_NOW, server_default=_UTC_NOW)
     processed_at = Column(DateTime, nullable=True)
 
     # Relationships
     client = relationship("ClientProfile", back_populates="documents")
 
+    __table_args__ = (
+        Index("ix_doc_loa_id", "loa_id"),
+        Index("ix_doc_client_id", "client_id"),
+    )
+
 
 class PostAdviceItem(Base):
     """Post-advice task/item tracking (forms, questionnaires, AML, etc.)."""
@@ -163,12 +252,14 @@ class PostAdviceItem(Base):
     rejection_reason = Column(Text, nullable=True)
     resubmission_count = Column(Integer, default=0)
 
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=_PY_UTC_NOW, server_default=_UTC_NOW)
+    updated_at = Column(DateTime, default=_PY_UTC_NOW, server_default=_UTC_NOW, onupdate=_UTC_NOW)
 
     # Relationships
     client = relationship("ClientProfile", back_populates="post_advice_items")
 
+    __table_args__ = (Index("ix_post_advice_client_state", "client_id", "current_state"),)
+
 
 class CommunicationLog(Base):
     """Communication log with sentiment tracking."""
@@ -189,11 +280,13 @@ class CommunicationLog(Base):
     contains_question = Column(Boolean, default=False)
     response_time_hours = Column(Float, nullable=True)
 
-    sent_at = Column(DateTime, default=datetime.utcnow)
+    sent_at = Column(DateTime, default=_PY_UTC_NOW, server_default=_UTC_NOW)
 
     # Relationships
     client = relationship("ClientProfile", back_populates="communications")
 
+    __table_args__ = (Index("ix_comm_client_sent_at", "client_id", "sent_at"),)
+
 
 # ---------- Session Factory ----------
 
@@ -234,62 +327,119 @@ def session_scope() -> Iterator[Session]:
         session.close()
 
 
-def _migrate_escalated_at() -> None:
+@contextmanager
+def session_or_scope(db: Session | None = None) -> Iterator[Session]:
+    """
+    Yield the caller's session if one is given, otherwise open a new session_scope().
+
+    When db is passed, the caller owns the transaction (commit/rollback/close);
+    helpers that accept an optional db use this so one session can be shared
+    across a batch of calls.
+    """
+    if db is not None:
+        yield db
+        return
+    with session_scope() as session:
+        yield session
+
+
+def get_loa_with_client(db: Session, loa_id: str) -> LOAWorkflow | None:
+    """Load one LOA with its client already loaded, so loa.client does not lazy-load a further SELECT."""
+    return db.execute(
+        select(LOAWorkflow)
+        .options(selectinload(LOAWorkflow.client))
+        .where(LOAWorkflow.loa_id == loa_id)
+    ).scalar_one_or_none()
+
+
+def bulk_insert(session: Session | Connection, model: type, rows: List[Dict[str, Any]]) -> None:
+    """
+    Insert many rows of model in one Core executemany (multi-row VALUES batches).
+
+    Skips the per-object ORM flush of session.add() loops; seed and import scripts
+    should use this for anything more than a handful of rows. Python-side column
+    defaults still apply; the caller's session (or Core connection) owns the transaction.
+
+    Usage:
+        with session_scope() as db:
+            bulk_insert(db, ClientProfile, [{"client_id": "C001", "name": "Alice"}, ...])
+    """
+    if rows:
+        session.execute(insert(model), rows)
+
+
+# Below this many rows the COPY setup costs more than a multi-row INSERT.
+BULK_COPY_MIN_ROWS = 100
+
+
+def bulk_copy(
+    session: Session | Connection,
+    model: type,
+    rows: List[Dict[str, Any]],
+    columns: Sequence[str] | None = None,
+) -> None:
+    """
+    Load many rows of model with PostgreSQL COPY; falls back to bulk_insert elsewhere.
+
+    For high-volume ingest (historical CommunicationLog, DocumentSubmission). COPY runs
+    on the session's (or Core connection's) own DBAPI connection, so it shares the caller's
+    transaction. Only psycopg2 has copy_expert, so other PostgreSQL drivers take the
+    bulk_insert path too. Unlike bulk_insert, Python-side column defaults are not applied:
+    pass every column the table needs. Empty strings load as NULL.
+    """
+    if not rows:
+        return
+    conn = session.connection() if isinstance(session, Session) else session
+    if conn.dialect.driver != "psycopg2" or len(rows) < BULK_COPY_MIN_ROWS:
+        bulk_insert(session, model, rows)
+        return
+    columns = list(columns or rows[0].keys())
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    for row in rows:
+        writer.writerow([row.get(c) for c in columns])
+    buf.seek(0)
+    table = model.__table__.name
+    column_list = ", ".join(f'"{c}"' for c in columns)
+    with conn.connection.cursor() as cur:
+        cur.copy_expert(f'COPY "{table}" ({column_list}) FROM STDIN WITH (FORMAT csv)', buf)
+
+
+def _has_column(conn, table: str, column: str) -> bool:
+    """Whether table already has column (catalog lookup, so no-op ALTERs never take a table lock)."""
+    if conn.dialect.name == "sqlite":
+        # PRAGMA does not take bound parameters; table is always a literal from the migrations below
+        rows = conn.execute(text(f"PRAGMA table_info({table})")).fetchall()
+        return any(row[1] == column for row in rows)
+    return conn.execute(
+        text(
+            "SELECT 1 FROM information_schema.columns "
+            "WHERE table_schema = current_schema() AND table_name = :t AND column_name = :c LIMIT 1"
+        ),
+        {"t": table, "c": column},
+    ).first() is not None
+
+
+def _add_column_if_missing(conn, table: str, column: str, ddl_type: str) -> None:
+    if not _has_column(conn, table, column):
+        conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl_type}"))
+
+
+def _migrate_escalated_at(conn) -> None:
     """Add escalated_at to loa_workflows if missing (for existing DBs)."""
-    with engine.connect() as conn:
-        if engine.dialect.name == "postgresql":
-            conn.execute(
-                text(
-                    "ALTER TABLE loa_workflows ADD COLUMN IF NOT EXISTS escalated_at TIMESTAMP"
-                )
-            )
-        elif engine.dialect.name == "sqlite":
-            try:
-                conn.execute(
-                    text(
-                        "ALTER TABLE loa_workflows ADD COLUMN escalated_at DATETIME"
-                    )
-                )
-            except Exception:
-                pass
-        conn.commit()
-
-
-def _migrate_document_loa_link() -> None:
+    timestamp_type = "DATETIME" if conn.dialect.name == "sqlite" else "TIMESTAMP"
+    _add_column_if_missing(conn, "loa_workflows", "escalated_at", timestamp_type)
+
+
+def _migrate_document_loa_link(conn) -> None:
     """Add loa_id to document_submissions and pending_document_id to loa_workflows (for existing DBs)."""
-    with engine.connect() as conn:
-        if engine.dialect.name == "postgresql":
-            conn.execute(
-                text(
-                    "ALTER TABLE document_submissions ADD COLUMN IF NOT EXISTS loa_id VARCHAR REFERENCES loa_workflows(loa_id)"
-                )
-            )
-            conn.execute(
-                text(
-                    "ALTER TABLE loa_workflows ADD COLUMN IF NOT EXISTS pending_document_id VARCHAR"
-                )
-            )
-        elif engine.dialect.name == "sqlite":
-            try:
-                conn.execute(
-                    text(
-                        "ALTER TABLE document_submissions ADD COLUMN loa_id VARCHAR REFERENCES loa_workflows(loa_id)"
-                    )
-                )
-            except Exception:
-                pass
-            try:
-                conn.execute(
-                    text(
-                        "ALTER TABLE loa_workflows ADD COLUMN pending_document_id VARCHAR"
-                    )
-                )
-            except Exception:
-                pass
-        conn.commit()
-
-
-def _migrate_workflow_states_to_descriptive() -> None:
+    _add_column_if_missing(
+        conn, "document_submissions", "loa_id", "VARCHAR REFERENCES loa_workflows(loa_id)"
+    )
+    _add_column_if_missing(conn, "loa_workflows", "pending_document_id", "VARCHAR")
+
+
+def _migrate_workflow_states_to_descriptive(conn) -> None:
     """Rename all workflow states to descriptive names (single source of truth in orchestration.workflow_states)."""
     # Order matters: map legacy/short names to new descriptive names (no new name appears as left-hand side)
     updates = [
@@ -303,20 +453,93 @@ def _migrate_workflow_states_to_descriptive() -> None:
         ("Info Received", "Provider Info Received - Notify Client"),
         ("Complete", "Case Complete"),
     ]
-    with engine.connect() as conn:
-        for old_val, new_val in updates:
-            conn.execute(
-                text(
-                    "UPDATE loa_workflows SET current_state = :new WHERE current_state = :old"
-                ),
-                {"new": new_val, "old": old_val},
-            )
-        conn.commit()
+    # One UPDATE with a CASE over all renames (equivalent to applying them in order, since no
+    # new name is also an old one); rows already on descriptive names are not touched
+    cases = " ".join(f"WHEN :old{i} THEN :new{i}" for i in range(len(updates)))
+    params: dict[str, object] = {f"old{i}": old for i, (old, _) in enumerate(updates)}
+    params.update({f"new{i}": new for i, (_, new) in enumerate(updates)})
+    params["olds"] = [old for old, _ in updates]
+    stmt = text(
+        f"UPDATE loa_workflows SET current_state = CASE current_state {cases} ELSE current_state END "
+        "WHERE current_state IN :olds"
+    ).bindparams(bindparam("olds", expanding=True))
+    conn.execute(stmt, params)
+
+
+def _migrate_add_indexes(conn) -> None:
+    """Create the model indexes on tables that predate them (create_all only indexes new tables)."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=conn, checkfirst=True)
+
+
+# Columns whose timestamp moved from a Python default to a server default
+_SERVER_TIMESTAMP_COLUMNS = (
+    ("client_profiles", "created_at"),
+    ("client_profiles", "updated_at"),
+    ("loa_workflows", "created_at"),
+    ("loa_workflows", "updated_at"),
+    ("document_submissions", "submitted_at"),
+    ("post_advice_items", "created_at"),
+    ("post_advice_items", "updated_at"),
+    ("communication_logs", "sent_at"),
+)
+
+
+def _migrate_server_timestamp_defaults(conn) -> None:
+    """Give pre-existing timestamp columns their server default (PostgreSQL; SQLite keeps the Python default)."""
+    if conn.dialect.name != "postgresql":
+        return
+    for table, column in _SERVER_TIMESTAMP_COLUMNS:
+        conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT {_UTC_NOW_SQL}"))
+
+
+# Append to _MIGRATIONS (with the next version number) when adding a migration; each runs once per
+# database. Migrations take the shared connection from _run_migrations and must not commit themselves.
+_MIGRATIONS = (
+    (1, _migrate_escalated_at),
+    (2, _migrate_document_loa_link),
+    (3, _migrate_workflow_states_to_descriptive),
+    (4, _migrate_add_indexes),
+    (5, _migrate_server_timestamp_defaults),
+)
+SCHEMA_VERSION = _MIGRATIONS[-1][0]
+
+
+def _get_schema_version(conn) -> int:
+    """Stored schema version: PRAGMA user_version on SQLite, the _schema_meta table elsewhere (0 if unset)."""
+    if conn.dialect.name == "sqlite":
+        return conn.execute(text("PRAGMA user_version")).scalar() or 0
+    conn.execute(text("CREATE TABLE IF NOT EXISTS _schema_meta (version INTEGER NOT NULL)"))
+    return conn.execute(text("SELECT MAX(version) FROM _schema_meta")).scalar() or 0
+
+
+def _set_schema_version(conn, version: int) -> None:
+    if conn.dialect.name == "sqlite":
+        # PRAGMA does not take bound parameters; version is always an int from _MIGRATIONS
+        conn.execute(text(f"PRAGMA user_version = {int(version)}"))
+        return
+    conn.execute(text("DELETE FROM _schema_meta"))
+    conn.execute(text("INSERT INTO _schema_meta (version) VALUES (:v)"), {"v": version})
+
+
+def _run_migrations() -> None:
+    """Apply pending migrations on one connection and transaction, recording each version as it lands."""
+    with engine.begin() as conn:
+        version = _get_schema_version(conn)
+        if version >= SCHEMA_VERSION:
+            return
+        for target, migrate in _MIGRATIONS:
+            if version < target:
+                migrate(conn)
+                _set_schema_version(conn, target)
 
 
 def init_db() -> None:
-    """Create all database tables and run any pending migrations."""
+    """
+    Create all database tables and run any pending migrations.
+    Migrations already recorded in the stored schema version are skipped, so a
+    current database costs one version lookup instead of re-running every ALTER/UPDATE.
+    """
     Base.metadata.create_all(bind=engine)
-    _migrate_escalated_at()
-    _migrate_document_loa_link()
-    _migrate_workflow_states_to_descriptive()
\ No newline at end of file
+    _run_migrations()
@@ -7,8 +7,10 @@ Trains on synthetic data and provides prediction functions for agents.
 from __future__ import annotations
 
 import pickle
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple
+from typing import Any, Dict, List, Sequence, Tuple
 
 import joblib
 import numpy as np
@@ -21,6 +23,51 @@ from sklearn.model_selection import train_test_split
 from config.config import settings
 
 
+# Loaded estimators shared by every caller in the process (agents, dashboard sessions, chaser),
+# keyed by file path; an entry is reused while the file's mtime is unchanged, so retraining
+# (which rewrites the file) is picked up without a restart.
+_MODEL_CACHE: Dict[Path, Tuple[float, Any]] = {}
+
+
+def _load_joblib(path: Path) -> Any:
+    """joblib.load through _MODEL_CACHE: unpickle once per file version, not once per prediction."""
+    mtime = path.stat().st_mtime
+    hit = _MODEL_CACHE.get(path)
+    if hit is not None and hit[0] == mtime:
+        return hit[1]
+    obj = joblib.load(path)
+    _MODEL_CACHE[path] = (mtime, obj)
+    return obj
+
+
+def reset_model_cache() -> None:
+    """Drop all loaded estimators; called after training so this process reloads the new files."""
+    _MODEL_CACHE.clear()
+    _sentiment_weights.cache_clear()
+    _priority_tables.cache_clear()
+
+
+def _read_training_csv(path: Path, column_types: Dict[str, str]) -> pd.DataFrame:
+    """
+    Read only the given columns of a training CSV with fixed types.
+    
+    Uses the multi-threaded pyarrow CSV parser when pyarrow is installed, else pandas' C engine.
+    """
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pacsv
+    except ImportError:
+        return pd.read_csv(path, usecols=list(column_types), dtype=column_types)
+    table = pacsv.read_csv(
+        path,
+        convert_options=pacsv.ConvertOptions(
+            include_columns=list(column_types),
+            column_types={name: pa.type_for_alias(t) for name, t in column_types.items()},
+        ),
+    )
+    return table.to_pandas()
+
+
 # ========== SENTIMENT ANALYSIS ==========
 
 
@@ -38,7 +85,7 @@ def train_sentiment_model(data_path: Path | None = None) -> Tuple[LogisticRegres
         data_path = settings.paths.synthetic_data_dir / "10_sentiment_training_data.csv"
     
     # Load data
-    df = pd.read_csv(data_path)
+    df = _read_training_csv(data_path, {"message_text": "str", "sentiment_label": "str"})
     
     # Features: message text
     X = df["message_text"].fillna("")
@@ -72,6 +119,7 @@ def train_sentiment_model(data_path: Path | None = None) -> Tuple[LogisticRegres
     
     joblib.dump(model, model_path)
     joblib.dump(vectorizer, vectorizer_path)
+    reset_model_cache()
     
     print(f"  Saved to: {model_path}")
     
@@ -85,20 +133,86 @@ def load_sentiment_model() -> Tuple[LogisticRegression, TfidfVectorizer]:
     Returns:
         Tuple of (model, vectorizer)
     """
-    model_path = settings.ml.sentiment_model_path
-    vectorizer_path = settings.ml.vectorizer_path
-    
-    if not model_path.exists() or not vectorizer_path.exists():
+    try:
+        model = _load_joblib(settings.ml.sentiment_model_path)
+        vectorizer = _load_joblib(settings.ml.vectorizer_path)
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Sentiment model not found. Run train_sentiment_model() first."
-        )
-    
-    model = joblib.load(model_path)
-    vectorizer = joblib.load(vectorizer_path)
+        ) from None
     
     return model, vectorizer
 
 
+# TfidfVectorizer defaults used in train_sentiment_model: lowercase, this token pattern,
+# raw term counts, smooth idf, L2 norm.
+_TOKEN_RE = re.compile(r"(?u)\b\w\w+\b")
+
+
+@lru_cache(maxsize=1)
+def _sentiment_weights(
+    model: LogisticRegression, vectorizer: TfidfVectorizer
+) -> Tuple[Dict[str, int], np.ndarray, np.ndarray, np.ndarray, List[str]]:
+    """
+    Freeze a fitted vectorizer + LR into (vocab, idf, W, b, classes) for plain-numpy inference.
+    
+    Keyed on the estimator objects, so a reload through _MODEL_CACHE after retraining
+    produces a fresh entry.
+    """
+    vocab = {term: int(idx) for term, idx in vectorizer.vocabulary_.items()}
+    idf = vectorizer.idf_.astype(np.float32)
+    W = model.coef_.astype(np.float32)
+    b = model.intercept_.astype(np.float32)
+    if W.shape[0] == 1:
+        # Binary LR stores one row; softmax over [0, z] equals its sigmoid
+        W = np.vstack([np.zeros_like(W), W])
+        b = np.concatenate([np.zeros_like(b), b])
+    return vocab, idf, W, b, model.classes_.tolist()
+
+
+def _tfidf_into(row: np.ndarray, message: str, vocab: Dict[str, int], idf: np.ndarray) -> None:
+    """Fill a zeroed row with the message's L2-normalised 1-2 gram tf-idf vector."""
+    tokens = _TOKEN_RE.findall(message.lower())
+    for term in tokens:
+        idx = vocab.get(term)
+        if idx is not None:
+            row[idx] += 1.0
+    for first, second in zip(tokens, tokens[1:]):
+        idx = vocab.get(f"{first} {second}")
+        if idx is not None:
+            row[idx] += 1.0
+    row *= idf
+    norm = float(np.sqrt(row @ row))
+    if norm > 0.0:
+        row /= norm
+
+
+def predict_sentiment_batch(messages: Sequence[str]) -> List[Tuple[str, float]]:
+    """
+    Predict sentiment for many messages with one (N, vocab) @ W.T matmul.
+    
+    Args:
+        messages: Client/advisor message texts
+    
+    Returns:
+        List of (sentiment_label, confidence_score), in input order
+    """
+    if not messages:
+        return []
+    model, vectorizer = load_sentiment_model()
+    vocab, idf, W, b, classes = _sentiment_weights(model, vectorizer)
+    X = np.zeros((len(messages), len(idf)), dtype=np.float32)
+    for row, message in zip(X, messages):
+        _tfidf_into(row, message, vocab, idf)
+    scores = X @ W.T + b
+    scores -= scores.max(axis=1, keepdims=True)
+    proba = np.exp(scores)
+    proba /= proba.sum(axis=1, keepdims=True)
+    best = proba.argmax(axis=1)
+    confidences = proba[np.arange(len(best)), best]
+    return [(classes[i], float(conf)) for i, conf in zip(best, confidences)]
+
+
 def predict_sentiment(message: str) -> Tuple[str, float]:
     """
     Predict sentiment of a message.
@@ -110,16 +224,7 @@ def predict_sentiment(message: str) -> Tuple[str, float]:
         Tuple of (sentiment_label, confidence_score)
         Labels: Positive, Neutral, Frustrated, Confused
     """
-    model, vectorizer = load_sentiment_model()
-    
-    # Vectorize
-    X = vectorizer.transform([message])
-    
-    # Predict
-    sentiment = model.predict(X)[0]
-    confidence = model.predict_proba(X).max()
-    
-    return sentiment, confidence
+    return predict_sentiment_batch([message])[0]
 
 
 # ========== PRIORITY SCORING ==========
@@ -139,7 +244,16 @@ def train_priority_model(data_path: Path | None = None) -> GradientBoostingRegre
         data_path = settings.paths.synthetic_data_dir / "11_priority_scoring_data.csv"
     
     # Load data
-    df = pd.read_csv(data_path)
+    df = _read_training_csv(
+        data_path,
+        {
+            "days_in_current_state": "int32",
+            "sla_overdue": "int32",
+            "client_age_55_plus": "int8",
+            "document_quality_score": "float32",
+            "priority_score_calculated": "float32",
+        },
+    )
     
     # Features
     feature_cols = [
@@ -177,6 +291,7 @@ def train_priority_model(data_path: Path | None = None) -> GradientBoostingRegre
     # Save
     model_path = settings.ml.priority_model_path
     joblib.dump(model, model_path)
+    reset_model_cache()
     
     print(f"  Saved to: {model_path}")
     
@@ -190,15 +305,86 @@ def load_priority_model() -> GradientBoostingRegressor:
     Returns:
         Trained GradientBoostingRegressor
     """
-    model_path = settings.ml.priority_model_path
-    
-    if not model_path.exists():
+    try:
+        return _load_joblib(settings.ml.priority_model_path)
+    except FileNotFoundError:
         raise FileNotFoundError(
             f"Priority model not found. Run train_priority_model() first."
-        )
+        ) from None
+
+
+@lru_cache(maxsize=1)
+def _priority_tables(model: GradientBoostingRegressor) -> Tuple[np.ndarray, ...] | None:
+    """
+    Flatten a fitted GBR into padded (n_trees, n_nodes) arrays for vectorised traversal.
     
-    model = joblib.load(model_path)
-    return model
+    Returns (feature, threshold, left, right, value, init, depth), or None when the model
+    is not a single-output GBR (then callers use model.predict). Leaves point back to
+    themselves with an infinite threshold, so every sample can take exactly depth steps.
+    Keyed on the estimator object, like _sentiment_weights.
+    """
+    estimators = getattr(model, "estimators_", None)
+    if estimators is None or estimators.ndim != 2 or estimators.shape[1] != 1:
+        return None
+    trees = [est.tree_ for est in estimators[:, 0]]
+    n_trees, n_nodes = len(trees), max(t.node_count for t in trees)
+    feature = np.zeros((n_trees, n_nodes), dtype=np.intp)
+    threshold = np.full((n_trees, n_nodes), np.inf)
+    left = np.zeros((n_trees, n_nodes), dtype=np.intp)
+    right = np.zeros((n_trees, n_nodes), dtype=np.intp)
+    value = np.zeros((n_trees, n_nodes))
+    for i, tree in enumerate(trees):
+        n = tree.node_count
+        nodes = np.arange(n)
+        leaf = tree.children_left == -1
+        feature[i, :n] = np.where(leaf, 0, tree.feature)
+        threshold[i, :n] = np.where(leaf, np.inf, tree.threshold)
+        left[i, :n] = np.where(leaf, nodes, tree.children_left)
+        right[i, :n] = np.where(leaf, nodes, tree.children_right)
+        value[i, :n] = tree.value[:, 0, 0]
+    value *= model.learning_rate
+    if model.init_ == "zero":
+        init = 0.0
+    else:
+        init = float(np.ravel(model.init_.predict(np.zeros((1, model.n_features_in_))))[0])
+    depth = max(t.max_depth for t in trees)
+    return feature, threshold, left, right, value, init, depth
+
+
+def _predict_priority_raw(model: GradientBoostingRegressor, X: np.ndarray) -> np.ndarray:
+    """GBR prediction over all trees at once (depth vectorised steps instead of per-tree Python calls)."""
+    tables = _priority_tables(model)
+    if tables is None:
+        return model.predict(X)
+    feature, threshold, left, right, value, init, depth = tables
+    # sklearn trees compare float32-cast inputs against float64 thresholds; do the same
+    X32 = X.astype(np.float32)
+    rows = np.arange(len(X))[:, None]
+    trees = np.arange(feature.shape[0])[None, :]
+    nodes = np.zeros((len(X), feature.shape[0]), dtype=np.intp)
+    for _ in range(depth):
+        go_left = X32[rows, feature[trees, nodes]] <= threshold[trees, nodes]
+        nodes = np.where(go_left, left[trees, nodes], right[trees, nodes])
+    return init + value[trees, nodes].sum(axis=1)
+
+
+def calculate_priority_scores(features: Any) -> List[float]:
+    """
+    Calculate priority scores for many LOAs in one vectorised pass over the GBR trees.
+    
+    Args:
+        features: Array-like of shape (N, 4) with columns
+            [days_in_state, max(0, sla_overdue), client_age_55_plus (0/1), doc_quality_score]
+    
+    Returns:
+        Priority scores (0-10 scale) as native floats, in input order
+    """
+    X = np.asarray(features, dtype=np.float64)
+    if X.size == 0:
+        return []
+    model = load_priority_model()
+    # Clamp to 0-10; tolist() gives native floats for SQLAlchemy/psycopg2
+    return np.clip(_predict_priority_raw(model, X), 0.0, 10.0).tolist()
 
 
 def calculate_priority_score(
@@ -219,21 +405,12 @@ def calculate_priority_score(
     Returns:
         Priority score (0-10 scale)
     """
-    model = load_priority_model()
-    
-    # Prepare features
-    features = [[
+    return calculate_priority_scores([[
         days_in_state,
         max(0, sla_overdue),  # Clamp to 0 minimum
         1 if client_age_55_plus else 0,
         doc_quality_score,
-    ]]
-    
-    # Predict (sklearn returns numpy scalar; convert to Python float for DB/JSON compatibility)
-    priority = model.predict(features)[0]
-    # Clamp to 0-10 range and ensure native float for SQLAlchemy/psycopg2
-    priority = float(max(0.0, min(10.0, priority)))
-    return priority
+    ]])[0]
 
 
 # ========== HELPER FUNCTIONS ==========
@@ -1,10 +1,23 @@
 """Orchestration: shared state and LangGraph workflow for Agentic Chaser."""
 
+from __future__ import annotations
+
+from typing import Any
+
 from .state import ChaserState, initial_state
-from .state_graph import get_chaser_graph
 
 __all__ = [
     "ChaserState",
     "initial_state",
     "get_chaser_graph",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import get_chaser_graph (LangGraph and every agent) only when first used (PEP 562)."""
+    if name == "get_chaser_graph":
+        from .state_graph import get_chaser_graph
+
+        globals()[name] = get_chaser_graph
+        return get_chaser_graph
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -80,6 +80,4 @@ def initial_state(loa_id: str, **kwargs: Any) -> Dict[str, Any]:
     Returns:
         Dict suitable for graph.invoke(initial_state(loa_id="L001")).
     """
-    state: Dict[str, Any] = {"loa_id": loa_id}
-    state.update(kwargs)
-    return state
+    return {"loa_id": loa_id, **kwargs}
@@ -8,9 +8,11 @@ Result is the final state dict (e.g. generated_message, next_action, error).
 from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, Literal
 
 from langgraph.graph import END, START, StateGraph
+from sqlalchemy import select, update
 
 from agents.client_comms import client_communication_agent
 from agents.document_processing import document_processing_agent
@@ -33,29 +35,29 @@ def _orchestrator_node(state: Dict[str, Any]) -> Dict[str, Any]:
     return workflow_orchestrator_agent(state)
 
 
+# next_action -> node after the orchestrator; anything else ends the run
+_ROUTE_TABLE: Dict[str, str] = {
+    "client_communication": "prepare_client",
+    "client_notification": "prepare_client",
+    "provider_submission": "provider_rpa",
+    "provider_follow_up": "provider_comms",
+    "provider_urgent_follow_up": "provider_comms",
+    "provider_clarification": "provider_comms",
+    "document_verification": "document_processing",
+}
+
+
 def _route_after_orchestrator(
     state: Dict[str, Any],
 ) -> Literal["prepare_client", "provider_comms", "provider_rpa", "document_processing", "__end__"]:
     """Route to the next node based on next_action from the orchestrator."""
-    next_action = (state.get("next_action") or "").strip()
-    if next_action in ("client_communication", "client_notification"):
-        return "prepare_client"
-    if next_action == "provider_submission":
-        return "provider_rpa"
-    if next_action in (
-        "provider_follow_up",
-        "provider_urgent_follow_up",
-        "provider_clarification",
-    ):
-        return "provider_comms"
-    if next_action == "document_verification":
-        return "document_processing"
-    return "__end__"
+    return _ROUTE_TABLE.get((state.get("next_action") or "").strip(), "__end__")
 
 
 def _document_processing_node(state: Dict[str, Any]) -> Dict[str, Any]:
     """Run document verification for pending_document_id; state must have document_id."""
-    state = {**state, "run_ocr": True}
+    # Nodes get their own dict from LangGraph (agents already write into it), so set keys in place
+    state["run_ocr"] = True
     return document_processing_agent(state)
 
 
@@ -70,29 +72,36 @@ def _post_document_verification_node(state: Dict[str, Any]) -> Dict[str, Any]:
     quality_issues = state.get("quality_issues") or ""
     document_type = ""
 
+    # Direct UPDATE / scalar SELECT: neither needs ORM objects, so skip the LOA and document fetches
+    values: Dict[str, Any] = {
+        "pending_document_id": None,
+        "updated_at": datetime.utcnow(),
+        "days_in_current_state": 0,
+    }
+    if validation_passed:
+        values.update(signature_verified=True, current_state=SIGNED_LOA_READY_FOR_PROVIDER)
+    else:
+        values["current_state"] = CLIENT_DOCUMENTS_REJECTED
     with session_scope() as db:
-        loa = db.query(LOAWorkflow).filter_by(loa_id=loa_id).first()
-        if loa:
-            loa.pending_document_id = None
-            loa.updated_at = datetime.utcnow()
-            if validation_passed:
-                loa.signature_verified = True
-                loa.current_state = SIGNED_LOA_READY_FOR_PROVIDER
-                loa.days_in_current_state = 0
-            else:
-                loa.current_state = CLIENT_DOCUMENTS_REJECTED
-                loa.days_in_current_state = 0
+        db.execute(
+            update(LOAWorkflow)
+            .where(LOAWorkflow.loa_id == loa_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
         if not validation_passed and state.get("document_id"):
-            doc = db.query(DocumentSubmission).filter_by(document_id=state["document_id"]).first()
-            if doc and doc.document_type:
-                document_type = doc.document_type
+            document_type = db.execute(
+                select(DocumentSubmission.document_type).where(
+                    DocumentSubmission.document_id == state["document_id"]
+                )
+            ).scalar() or ""
 
     if validation_passed:
-        return {**state, "next_action": "complete", "reasoning": "LOA state set to Signed LOA - Ready for Provider; verification complete."}
+        return {"next_action": "complete", "reasoning": "LOA state set to Signed LOA - Ready for Provider; verification complete."}
     # Failed: add document_type to context so client message can reference the rejected document
     missing_label = f"{document_type} (signed LOA or supporting documents)" if document_type else "signed LOA or supporting documents"
+    # Return only the changed keys; LangGraph merges them into the state
     return {
-        **state,
         "current_state": CLIENT_DOCUMENTS_REJECTED,
         "next_action": "client_communication",
         "communication_type": "document_request",
@@ -111,16 +120,16 @@ def _prepare_client_node(state: Dict[str, Any]) -> Dict[str, Any]:
     next_action = state.get("next_action", "")
     current_state = state.get("current_state", "")
     if next_action == "client_notification":
-        state = {**state, "communication_type": "status_update"}
+        state["communication_type"] = "status_update"
     elif next_action == "client_communication":
         if state.get("communication_type") == "document_request":
             pass  # already set by post_document_verification (Client Documents Rejected)
         elif current_state == AWAITING_CLIENT_SIGNATURE:
-            state = {**state, "communication_type": "loa_signature_request"}
+            state["communication_type"] = "loa_signature_request"
         else:
-            state = {**state, "communication_type": "general"}
+            state["communication_type"] = "general"
     elif state.get("communication_type") != "document_request":
-        state = {**state, "communication_type": "general"}
+        state["communication_type"] = "general"
     return client_communication_agent(state)
 
 
@@ -131,7 +140,7 @@ def _provider_comms_node(state: Dict[str, Any]) -> Dict[str, Any]:
 
 def _provider_rpa_node(state: Dict[str, Any]) -> Dict[str, Any]:
     """Submit LOA to provider (sets rpa_action=submit_loa)."""
-    state = {**state, "rpa_action": "submit_loa"}
+    state["rpa_action"] = "submit_loa"
     return provider_rpa_agent(state)
 
 
@@ -180,10 +189,14 @@ def _build_graph() -> StateGraph:
     return builder
 
 
+@lru_cache(maxsize=1)
 def get_chaser_graph():
     """
     Return the compiled LangGraph for the chaser workflow.
 
+    Compiled once per process and shared (the compiled graph holds no per-run state);
+    call get_chaser_graph.cache_clear() to rebuild after changing nodes or edges at runtime.
+
     Usage:
         from orchestration import get_chaser_graph, initial_state
         graph = get_chaser_graph()
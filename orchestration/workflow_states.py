@@ -22,19 +22,23 @@ PROVIDER_INFO_RECEIVED_NOTIFY_CLIENT = "Provider Info Received - Notify Client"
 # Terminal
 CASE_COMPLETE = "Case Complete"
 
-# Lists for filtering and validation
-CLIENT_CHASE_STATES = (
+# Ordered tuples for SQL IN (...) filters (stable order keeps the compiled statement cacheable)
+CLIENT_CHASE_STATES_TUPLE = (
     AWAITING_CLIENT_SIGNATURE,
     DOCUMENT_AWAITING_VERIFICATION,
     CLIENT_DOCUMENTS_REJECTED,
     PROVIDER_INFO_RECEIVED_NOTIFY_CLIENT,
 )
-PROVIDER_CHASE_STATES = (
+PROVIDER_CHASE_STATES_TUPLE = (
     SUBMITTED_TO_PROVIDER,
     WITH_PROVIDER_PROCESSING,
     PROVIDER_RESPONSE_INCOMPLETE,
 )
+
+# Sets for Python-side membership checks
+CLIENT_CHASE_STATES = frozenset(CLIENT_CHASE_STATES_TUPLE)
+PROVIDER_CHASE_STATES = frozenset(PROVIDER_CHASE_STATES_TUPLE)
 MARK_PROVIDER_INFO_RECEIVED_ALLOWED = PROVIDER_CHASE_STATES
-LINK_DOCUMENT_ALLOWED_STATES = (AWAITING_CLIENT_SIGNATURE, CLIENT_DOCUMENTS_REJECTED)
+LINK_DOCUMENT_ALLOWED_STATES = frozenset({AWAITING_CLIENT_SIGNATURE, CLIENT_DOCUMENTS_REJECTED})
 DOCUMENT_VERIFICATION_STATE = DOCUMENT_AWAITING_VERIFICATION
 DEFAULT_STATE = AWAITING_CLIENT_SIGNATURE
@@ -8,11 +8,16 @@ Idempotent: clears existing rows in dependency order, then bulk inserts.
 
 from __future__ import annotations
 
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Callable, Dict, List
 
+import numpy as np
 import pandas as pd
 
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
 from config.config import settings
 from models.database import (
     ClientProfile,
@@ -20,7 +25,9 @@ from models.database import (
     DocumentSubmission,
     LOAWorkflow,
     PostAdviceItem,
-    session_scope,
+    bulk_copy,
+    bulk_insert,
+    engine,
 )
 from orchestration.workflow_states import (
     AWAITING_CLIENT_SIGNATURE,
@@ -35,63 +42,244 @@ from orchestration.workflow_states import (
 )
 
 
-def _bool(s: str) -> bool:
-    if s is None or (isinstance(s, float) and pd.isna(s)):
-        return False
-    return str(s).strip().lower() in ("true", "1", "yes")
+try:
+    import pyarrow  # noqa: F401  (optional: multi-threaded CSV parsing)
 
+    _CSV_ENGINE = "pyarrow"
+except ImportError:
+    _CSV_ENGINE = "c"
 
-def _float(s) -> float | None:
-    if s is None or (isinstance(s, float) and pd.isna(s)) or str(s).strip() == "":
-        return None
-    try:
-        return float(s)
-    except (TypeError, ValueError):
-        return None
+_TRUE = frozenset({"true", "1", "yes"})
 
 
-def _int(s) -> int | None:
-    if s is None or (isinstance(s, float) and pd.isna(s)) or str(s).strip() == "":
-        return None
-    try:
-        return int(float(s))
-    except (TypeError, ValueError):
-        return None
+# Parsed CSVs at least this long are kept as Parquet sidecars (needs pyarrow); smaller ones
+# parse faster than the cache round-trip
+PARQUET_CACHE_MIN_ROWS = 1000
+
+
+def _parquet_cache_path(path: Path) -> Path:
+    return path.parent / ".cache" / f"{path.stem}.parquet"
+
+
+def _read_csv(path: Path) -> pd.DataFrame:
+    """
+    Read a test CSV with every column as string (no per-column type inference).
+
+    _records does the typing afterwards, tolerating bad cells, so the parser only tokenises.
+    Large CSVs are cached under .cache/ as Parquet and reused while newer than the CSV.
+    """
+    cache_path = _parquet_cache_path(path)
+    if _CSV_ENGINE == "pyarrow" and cache_path.exists() and cache_path.stat().st_mtime >= path.stat().st_mtime:
+        return pd.read_parquet(cache_path, engine="pyarrow")
+    df = pd.read_csv(path, dtype="string", engine=_CSV_ENGINE)
+    if _CSV_ENGINE == "pyarrow" and len(df) >= PARQUET_CACHE_MIN_ROWS:
+        try:
+            cache_path.parent.mkdir(exist_ok=True)
+            df.to_parquet(cache_path, engine="pyarrow", compression="zstd")
+        except OSError:
+            pass  # cache is best-effort (e.g. read-only data dir)
+    return df
+
+
+def _column(df: pd.DataFrame, name: str) -> pd.Series:
+    """Column by name, or an all-missing column when the CSV does not have it."""
+    if name in df.columns:
+        return df[name]
+    return pd.Series(pd.NA, index=df.index, dtype="object")
+
+
+def _with_default(values: pd.Series, default: Any) -> pd.Series:
+    """Fill missing values; like the old `_x(...) or default`, zero/empty also take the default."""
+    if default is None:
+        return values
+    return values.where(values.notna() & (values != 0), default)
+
+
+def _records(
+    df: pd.DataFrame,
+    *,
+    required: tuple = (),
+    strings: Dict[str, Any] | None = None,
+    ints: Dict[str, Any] | None = None,
+    floats: Dict[str, Any] | None = None,
+    bools: tuple = (),
+    datetimes: tuple = (),
+) -> List[dict]:
+    """
+    Coerce CSV columns a whole column at a time and return insert-ready dicts.
+
+    required: str() as-is; a blank cell raises ValueError listing the CSV line numbers, instead of
+    failing the whole load on the NOT NULL constraint. strings: stripped, empty -> missing;
+    ints/floats: numeric, bad -> missing (ints truncate); bools: true/1/yes; datetimes: parsed to
+    naive UTC, bad -> missing. Dict values are the default for missing cells (None keeps them NULL).
+    Missing cells become None in the output.
+    """
+    out: Dict[str, pd.Series] = {}
+    for name in required:
+        values = _column(df, name)
+        blank = values.isna()
+        if blank.any():
+            # CSV line numbers: the header is line 1
+            rows = np.flatnonzero(blank.to_numpy())
+            lines = ", ".join(str(i + 2) for i in rows[:10]) + (", ..." if len(rows) > 10 else "")
+            raise ValueError(f"blank required column {name!r} on line(s) {lines}")
+        out[name] = values.astype(str)
+    for name, default in (strings or {}).items():
+        values = _column(df, name).astype("string").str.strip().replace("", pd.NA)
+        out[name] = values if default is None else values.fillna(default)
+    for name, default in (ints or {}).items():
+        values = np.trunc(pd.to_numeric(_column(df, name), errors="coerce")).astype("Int64")
+        out[name] = _with_default(values, default)
+    for name, default in (floats or {}).items():
+        values = pd.to_numeric(_column(df, name), errors="coerce").astype("Float64")
+        out[name] = _with_default(values, default)
+    for name in bools:
+        out[name] = _column(df, name).astype("string").str.strip().str.lower().isin(_TRUE).astype(bool)
+    for name in datetimes:
+        # One parse per column; "mixed" parses each cell's own format. utc=True lets naive and
+        # offset-suffixed cells share a column (otherwise "Mixed timezones detected" aborts the load);
+        # naive cells are taken as UTC and every value is stored as naive UTC, like utcnow()
+        parsed = pd.to_datetime(_column(df, name), errors="coerce", format="mixed", utc=True)
+        parsed = parsed.dt.tz_convert(None)
+        out[name] = pd.Series(parsed.dt.to_pydatetime(), index=df.index, dtype=object)
+    frame = pd.DataFrame(out, index=df.index)
+    return frame.astype(object).where(frame.notna(), None).to_dict(orient="records")
+
+
+# Legacy or short LOA state names -> current descriptive workflow states
+_LEGACY_LOA_STATE_MAP = {
+    "Prepared": AWAITING_CLIENT_SIGNATURE,
+    "Awaiting Document Verification": DOCUMENT_AWAITING_VERIFICATION,
+    "Client Signed": SIGNED_LOA_READY_FOR_PROVIDER,
+    "Provider Submitted": SUBMITTED_TO_PROVIDER,
+    "Provider Processing": WITH_PROVIDER_PROCESSING,
+    "Incomplete Info": PROVIDER_RESPONSE_INCOMPLETE,
+    "Provider Info Incomplete": PROVIDER_RESPONSE_INCOMPLETE,
+    "Info Received": PROVIDER_INFO_RECEIVED_NOTIFY_CLIENT,
+    "Complete": CASE_COMPLETE,
+}
+
+
+# Rows per executemany batch; keeps parameter lists bounded on every dialect
+BULK_BATCH_SIZE = 5000
+
+
+def _client_records(df: pd.DataFrame) -> List[dict]:
+    return _records(
+        df,
+        required=("client_id", "name"),
+        strings={
+            "employment_type": None,
+            "risk_profile": None,
+            "communication_preference": "Email",
+            "document_responsiveness": None,
+        },
+        ints={"age": None, "existing_pensions_count": 0},
+        floats={"annual_income": None},
+    )
 
 
-def _str(s) -> str | None:
-    if s is None or (isinstance(s, float) and pd.isna(s)):
-        return None
-    t = str(s).strip()
-    return t if t else None
+def _loa_records(df: pd.DataFrame) -> List[dict]:
+    # Normalise legacy state names over the whole column (missing/empty -> default in _records)
+    states = _column(df, "current_state").astype("string").str.strip()
+    return _records(
+        df.assign(current_state=states.replace(_LEGACY_LOA_STATE_MAP)),
+        required=("loa_id", "client_id", "provider"),
+        strings={
+            "case_type": "Pension Consolidation",
+            "current_state": AWAITING_CLIENT_SIGNATURE,
+            "reference_number": None,
+        },
+        ints={"days_in_current_state": 0, "sla_days": 15, "sla_days_remaining": None},
+        floats={"priority_score": 0.0, "document_quality_score": 75.0},
+        bools=("signature_verified", "needs_advisor_intervention", "sla_overdue"),
+    )
 
 
-def _dt(s) -> datetime | None:
-    if s is None or (isinstance(s, float) and pd.isna(s)) or str(s).strip() == "":
-        return None
+def _document_records(df: pd.DataFrame) -> List[dict]:
+    return _records(
+        df,
+        required=("document_id", "client_id", "document_type"),
+        strings={"document_subtype": None, "quality_issues": None, "file_path": None},
+        floats={"ocr_confidence_score": None},
+        bools=("validation_passed", "manual_review_required"),
+    )
+
+
+def _communication_records(df: pd.DataFrame) -> List[dict]:
+    return _records(
+        df,
+        required=("message_id", "client_id", "direction", "channel"),
+        strings={"message_text": None, "sentiment_label": None},
+        ints={"message_length_words": 0},
+        floats={"sentiment_score": None, "response_time_hours": None},
+        bools=("contains_question",),
+    )
+
+
+def _post_advice_records(df: pd.DataFrame) -> List[dict]:
+    return _records(
+        df,
+        required=("item_id", "client_id", "item_type"),
+        strings={"current_state": "Pending", "sent_via": None, "rejection_reason": None},
+        ints={"days_outstanding": 0, "days_until_deadline": None, "resubmission_count": 0},
+        floats={"completion_percentage": 0.0},
+        bools=("opened",),
+        datetimes=("last_interaction_date",),
+    )
+
+
+# (csv file, model, record builder, required) in dependency order; optional files are skipped if absent
+_TABLES = (
+    ("client_profiles.csv", ClientProfile, _client_records, True),
+    ("loa_workflows.csv", LOAWorkflow, _loa_records, True),
+    ("document_submissions.csv", DocumentSubmission, _document_records, False),
+    ("communication_logs.csv", CommunicationLog, _communication_records, False),
+    ("post_advice_items.csv", PostAdviceItem, _post_advice_records, False),
+)
+
+
+def _parse(path: Path, to_records: Callable[[pd.DataFrame], List[dict]]) -> List[dict]:
+    """Read and coerce one CSV (runs on a worker thread); coercion errors name the file."""
+    df = _read_csv(path)
     try:
-        return pd.to_datetime(s).to_pydatetime()
-    except Exception:
-        return None
-
-
-def _normalize_loa_state(s: str | None) -> str:
-    """Map legacy or short state names to current descriptive workflow states."""
-    if not s:
-        return AWAITING_CLIENT_SIGNATURE
-    v = s.strip()
-    legacy_to_new = {
-        "Prepared": AWAITING_CLIENT_SIGNATURE,
-        "Awaiting Document Verification": DOCUMENT_AWAITING_VERIFICATION,
-        "Client Signed": SIGNED_LOA_READY_FOR_PROVIDER,
-        "Provider Submitted": SUBMITTED_TO_PROVIDER,
-        "Provider Processing": WITH_PROVIDER_PROCESSING,
-        "Incomplete Info": PROVIDER_RESPONSE_INCOMPLETE,
-        "Provider Info Incomplete": PROVIDER_RESPONSE_INCOMPLETE,
-        "Info Received": PROVIDER_INFO_RECEIVED_NOTIFY_CLIENT,
-        "Complete": CASE_COMPLETE,
-    }
-    return legacy_to_new.get(v, v)
+        return to_records(df)
+    except ValueError as e:
+        raise ValueError(f"{path.name}: {e}") from e
+
+
+# High-volume history tables, loaded with COPY on PostgreSQL; their record builders set every column
+# that has a Python-side default (COPY skips those), timestamps come from the server default
+_COPY_MODELS = frozenset({CommunicationLog, DocumentSubmission})
+
+
+def _bulk_load(conn: Connection, model: type, rows: List[dict]) -> None:
+    """Insert rows as model via batched Core executemany (no per-row ORM objects), or COPY for _COPY_MODELS."""
+    if model in _COPY_MODELS:
+        bulk_copy(conn, model, rows)
+        return
+    for start in range(0, len(rows), BULK_BATCH_SIZE):
+        bulk_insert(conn, model, rows[start:start + BULK_BATCH_SIZE])
+
+
+# Cleared in reverse dependency order
+_CLEAR_ORDER = (
+    CommunicationLog.__tablename__,
+    PostAdviceItem.__tablename__,
+    DocumentSubmission.__tablename__,
+    LOAWorkflow.__tablename__,
+    ClientProfile.__tablename__,
+)
+
+
+def _clear_tables(conn: Connection) -> None:
+    """Empty the test-data tables with raw SQL: one TRUNCATE on PostgreSQL, plain DELETEs elsewhere."""
+    if conn.dialect.name == "postgresql":
+        # Listing every table lets TRUNCATE pass the FKs between them without CASCADE
+        conn.execute(text(f"TRUNCATE {', '.join(_CLEAR_ORDER)}"))
+        return
+    for table in _CLEAR_ORDER:
+        conn.execute(text(f"DELETE FROM {table}"))
 
 
 def load_test_data() -> None:
@@ -100,109 +288,22 @@ def load_test_data() -> None:
     if not test_dir.exists():
         raise FileNotFoundError(f"Test data directory not found: {test_dir}")
 
-    with session_scope() as db:
-        # Clear in reverse dependency order (session_scope commits on exit)
-        db.query(CommunicationLog).delete()
-        db.query(PostAdviceItem).delete()
-        db.query(DocumentSubmission).delete()
-        db.query(LOAWorkflow).delete()
-        db.query(ClientProfile).delete()
-
-    # Load and insert in dependency order
-    # 1. Client profiles
-    df_clients = pd.read_csv(test_dir / "client_profiles.csv")
-    with session_scope() as db:
-        for _, row in df_clients.iterrows():
-            db.add(ClientProfile(
-                client_id=str(row["client_id"]),
-                name=str(row["name"]),
-                age=_int(row.get("age")),
-                employment_type=_str(row.get("employment_type")),
-                annual_income=_float(row.get("annual_income")),
-                existing_pensions_count=_int(row.get("existing_pensions_count")) or 0,
-                risk_profile=_str(row.get("risk_profile")),
-                communication_preference=_str(row.get("communication_preference")) or "Email",
-                document_responsiveness=_str(row.get("document_responsiveness")),
-            ))
-
-    # 2. LOA workflows
-    df_loas = pd.read_csv(test_dir / "loa_workflows.csv")
-    with session_scope() as db:
-        for _, row in df_loas.iterrows():
-            db.add(LOAWorkflow(
-                loa_id=str(row["loa_id"]),
-                client_id=str(row["client_id"]),
-                provider=str(row["provider"]),
-                case_type=_str(row.get("case_type")) or "Pension Consolidation",
-                current_state=_normalize_loa_state(_str(row.get("current_state")) or AWAITING_CLIENT_SIGNATURE),
-                priority_score=_float(row.get("priority_score")) or 0.0,
-                days_in_current_state=_int(row.get("days_in_current_state")) or 0,
-                sla_days=_int(row.get("sla_days")) or 15,
-                sla_days_remaining=_int(row.get("sla_days_remaining")),
-                document_quality_score=_float(row.get("document_quality_score")) or 75.0,
-                signature_verified=_bool(row.get("signature_verified")),
-                reference_number=_str(row.get("reference_number")),
-                needs_advisor_intervention=_bool(row.get("needs_advisor_intervention")),
-                sla_overdue=_bool(row.get("sla_overdue")),
-            ))
-
-    # 3. Document submissions
-    doc_path = test_dir / "document_submissions.csv"
-    if doc_path.exists():
-        df_docs = pd.read_csv(doc_path)
-        with session_scope() as db:
-            for _, row in df_docs.iterrows():
-                db.add(DocumentSubmission(
-                    document_id=str(row["document_id"]),
-                    client_id=str(row["client_id"]),
-                    document_type=str(row["document_type"]),
-                    document_subtype=_str(row.get("document_subtype")),
-                    ocr_confidence_score=_float(row.get("ocr_confidence_score")),
-                    quality_issues=_str(row.get("quality_issues")),
-                    validation_passed=_bool(row.get("validation_passed")),
-                    manual_review_required=_bool(row.get("manual_review_required")),
-                    file_path=_str(row.get("file_path")),
-                ))
-
-    # 4. Communication logs
-    comm_path = test_dir / "communication_logs.csv"
-    if comm_path.exists():
-        df_comm = pd.read_csv(comm_path)
-        with session_scope() as db:
-            for _, row in df_comm.iterrows():
-                db.add(CommunicationLog(
-                    message_id=str(row["message_id"]),
-                    client_id=str(row["client_id"]),
-                    direction=str(row["direction"]),
-                    channel=str(row["channel"]),
-                    message_text=_str(row.get("message_text")),
-                    sentiment_label=_str(row.get("sentiment_label")),
-                    sentiment_score=_float(row.get("sentiment_score")),
-                    message_length_words=_int(row.get("message_length_words")) or 0,
-                    contains_question=_bool(row.get("contains_question")),
-                    response_time_hours=_float(row.get("response_time_hours")),
-                ))
-
-    # 5. Post advice items
-    pa_path = test_dir / "post_advice_items.csv"
-    if pa_path.exists():
-        df_pa = pd.read_csv(pa_path)
-        with session_scope() as db:
-            for _, row in df_pa.iterrows():
-                db.add(PostAdviceItem(
-                    item_id=str(row["item_id"]),
-                    client_id=str(row["client_id"]),
-                    item_type=str(row["item_type"]),
-                    current_state=_str(row.get("current_state")) or "Pending",
-                    days_outstanding=_int(row.get("days_outstanding")) or 0,
-                    days_until_deadline=_int(row.get("days_until_deadline")),
-                    completion_percentage=_float(row.get("completion_percentage")) or 0.0,
-                    sent_via=_str(row.get("sent_via")),
-                    opened=_bool(row.get("opened")),
-                    last_interaction_date=_dt(row.get("last_interaction_date")),
-                    rejection_reason=_str(row.get("rejection_reason")),
-                    resubmission_count=_int(row.get("resubmission_count")) or 0,
-                ))
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        # Parse/coerce CSVs in the background while the clear and earlier inserts hit the DB
+        pending = [
+            (model, pool.submit(_parse, test_dir / name, to_records))
+            for name, model, to_records, required in _TABLES
+            if required or (test_dir / name).exists()
+        ]
+
+        # One Core transaction (no ORM Session needed) for the clear and every insert: a single
+        # commit, and a failed load rolls back to the previous data instead of leaving it half-cleared
+        with engine.begin() as conn:
+            _clear_tables(conn)
+
+            # Insert in dependency order; each waits only for its own file's parse
+            for model, future in pending:
+                _bulk_load(conn, model, future.result())
 
 
 if __name__ == "__main__":
@@ -2,6 +2,26 @@
 Utility modules for Agentic Chaser.
 """
 
-from utils.llm_helpers import get_ollama_llm, chat_completion
+import threading
 
-__all__ = ["get_ollama_llm", "chat_completion"]
\ No newline at end of file
+from config.config import settings
+from utils.llm_helpers import (
+    chat_completion,
+    chat_completion_async,
+    chat_completion_batch,
+    get_ollama_llm,
+)
+
+__all__ = ["get_ollama_llm", "chat_completion", "chat_completion_async", "chat_completion_batch"]
+
+
+def _prime() -> None:
+    """Build the shared LLM client ahead of the first agent call; failures surface on real use."""
+    try:
+        get_ollama_llm()
+    except Exception:
+        pass
+
+
+if settings.app.prime_llm:
+    threading.Thread(target=_prime, name="llm-prime", daemon=True).start()
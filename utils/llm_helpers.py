@@ -7,8 +7,10 @@ All agents should use these helpers instead of directly creating LLM instances.
 
 from __future__ import annotations
 
+import re
+import threading
 from functools import lru_cache
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
@@ -21,12 +23,26 @@ except ImportError:
 
 from config.config import settings
 
+# Ollama settings snapshot taken at import (settings are frozen and loaded once per process);
+# the call path reads these module constants instead of walking settings.ollama each time.
+_OLLAMA_MODEL, _OLLAMA_BASE_URL, _OLLAMA_TEMPERATURE, _OLLAMA_TIMEOUT = (
+    settings.ollama.model,
+    settings.ollama.base_url,
+    settings.ollama.temperature,
+    settings.ollama.timeout,
+)
+
+
+# Errors meaning "model not pulled": HTTP 404, "not found", or "model ... does not exist" (either order)
+_OLLAMA_MISSING_MODEL_RE = re.compile(
+    r"404|not found|model.*does not exist|does not exist.*model", re.IGNORECASE | re.DOTALL
+)
+
 
 def _raise_ollama_help(e: Exception) -> None:
     """Re-raise with a clearer message when Ollama model is missing (404)."""
-    msg = str(e).lower()
-    if "404" in msg or "not found" in msg or "model" in msg and "does not exist" in msg:
-        model = getattr(settings.ollama, "model", "llama3.1:8b")
+    if _OLLAMA_MISSING_MODEL_RE.search(str(e)):
+        model = _OLLAMA_MODEL
         raise RuntimeError(
             f"Ollama model {model!r} is not installed. "
             f"Run: ollama pull {model}  (or set OLLAMA_MODEL in .env to a model from 'ollama list')"
@@ -34,10 +50,21 @@ def _raise_ollama_help(e: Exception) -> None:
     raise
 
 
-@lru_cache(maxsize=1)
+# Process-wide default LLM client, built once (double-checked under _LLM_LOCK) and reused
+# so its HTTP client is reused too.
+_LLM_LOCK = threading.Lock()
+_LLM: Optional[BaseChatModel] = None
+
+
+@lru_cache(maxsize=8)
+def _llm_for(model: str, base_url: str, temperature: float, timeout: float) -> BaseChatModel:
+    """ChatOllama per distinct configuration; a handful of temperature overrides stay warm."""
+    return ChatOllama(model=model, base_url=base_url, temperature=temperature, timeout=timeout)
+
+
 def get_ollama_llm() -> BaseChatModel:
     """
-    Get cached Ollama LLM instance.
+    Get the shared Ollama LLM instance (built on first use).
     
     Configuration comes from environment:
         OLLAMA_MODEL (default: llama3.1:8b)
@@ -46,16 +73,19 @@ def get_ollama_llm() -> BaseChatModel:
     Returns:
         BaseChatModel: Configured ChatOllama instance
     """
-    ollama_config = settings.ollama
-    
-    llm = ChatOllama(
-        model=ollama_config.model,
-        base_url=ollama_config.base_url,
-        temperature=ollama_config.temperature,
-        timeout=ollama_config.timeout,
-    )
-    
-    return llm
+    global _LLM
+    if _LLM is None:
+        with _LLM_LOCK:
+            if _LLM is None:
+                _LLM = _llm_for(_OLLAMA_MODEL, _OLLAMA_BASE_URL, _OLLAMA_TEMPERATURE, _OLLAMA_TIMEOUT)
+    return _LLM
+
+
+def _llm_for_temperature(temperature: Optional[float]) -> BaseChatModel:
+    """Shared LLM for a temperature override (None = default instance)."""
+    if temperature is None:
+        return get_ollama_llm()
+    return _llm_for(_OLLAMA_MODEL, _OLLAMA_BASE_URL, temperature, _OLLAMA_TIMEOUT)
 
 
 def chat_completion(
@@ -80,16 +110,7 @@ def chat_completion(
             user_prompt="Explain LOA to a client in simple terms."
         )
     """
-    llm = get_ollama_llm()
-    
-    # Override temperature if provided
-    if temperature is not None:
-        llm = ChatOllama(
-            model=settings.ollama.model,
-            base_url=settings.ollama.base_url,
-            temperature=temperature,
-            timeout=settings.ollama.timeout,
-        )
+    llm = _llm_for_temperature(temperature)
     
     messages = [
         SystemMessage(content=system_prompt),
@@ -102,6 +123,70 @@ def chat_completion(
     return response.content
 
 
+async def chat_completion_async(
+    system_prompt: str,
+    user_prompt: str,
+    temperature: Optional[float] = None,
+) -> str:
+    """
+    Async chat_completion: awaits the LLM without blocking the event loop,
+    so several calls can be in flight at once (e.g. via asyncio.gather).
+    """
+    llm = _llm_for_temperature(temperature)
+    messages = [
+        SystemMessage(content=system_prompt),
+        HumanMessage(content=user_prompt),
+    ]
+    try:
+        response: AIMessage = await llm.ainvoke(messages)
+    except Exception as e:
+        _raise_ollama_help(e)
+    return response.content
+
+
+# Upper bound on concurrent Ollama requests from one chat_completion_batch call
+BATCH_MAX_CONCURRENCY = 8
+
+
+async def chat_completion_batch(
+    prompts: List[Tuple[str, str]],
+    temperature: Optional[float] = None,
+) -> List[str]:
+    """
+    Run many (system_prompt, user_prompt) completions concurrently.
+    
+    Args:
+        prompts: List of (system_prompt, user_prompt) pairs
+        temperature: Optional temperature override (applies to all)
+    
+    Returns:
+        List of response texts, in prompt order
+    
+    Example:
+        replies = asyncio.run(chat_completion_batch([
+            ("You are a helpful assistant.", "Summarise LOA for Alice."),
+            ("You are a helpful assistant.", "Summarise LOA for Bob."),
+        ]))
+    """
+    if not prompts:
+        return []
+    llm = _llm_for_temperature(temperature)
+    batches = [
+        [SystemMessage(content=system_prompt), HumanMessage(content=user_prompt)]
+        for system_prompt, user_prompt in prompts
+    ]
+    try:
+        responses: List[AIMessage] = await llm.abatch(
+            batches, config={"max_concurrency": BATCH_MAX_CONCURRENCY}
+        )
+    except Exception as e:
+        _raise_ollama_help(e)
+    return [response.content for response in responses]
+
+
+_HISTORY_MESSAGE_TYPES = {"user": HumanMessage, "assistant": AIMessage}
+
+
 def chat_completion_with_history(
     system_prompt: str,
     messages: List[Dict[str, str]],
@@ -128,24 +213,15 @@ def chat_completion_with_history(
             ]
         )
     """
-    llm = get_ollama_llm()
-    
-    if temperature is not None:
-        llm = ChatOllama(
-            model=settings.ollama.model,
-            base_url=settings.ollama.base_url,
-            temperature=temperature,
-            timeout=settings.ollama.timeout,
-        )
+    llm = _llm_for_temperature(temperature)
     
-    # Build message list
+    # Build message list (entries with any other role are skipped)
     msg_list = [SystemMessage(content=system_prompt)]
-    
-    for msg in messages:
-        if msg["role"] == "user":
-            msg_list.append(HumanMessage(content=msg["content"]))
-        elif msg["role"] == "assistant":
-            msg_list.append(AIMessage(content=msg["content"]))
+    msg_list.extend(
+        message_type(content=msg["content"])
+        for msg in messages
+        if (message_type := _HISTORY_MESSAGE_TYPES.get(msg["role"])) is not None
+    )
     try:
         response: AIMessage = llm.invoke(msg_list)
     except Exception as e:
@@ -153,10 +229,14 @@ def chat_completion_with_history(
     return response.content
 
 
+@lru_cache(maxsize=128)
 def create_prompt_template(template: str) -> ChatPromptTemplate:
     """
     Create a reusable prompt template.
     
+    Parsed once per distinct template string and shared (keep templates as module-level
+    constants so repeat calls hit the cache; treat the result as read-only).
+    
     Args:
         template: Template string with {variables}
     